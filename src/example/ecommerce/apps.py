@@ -6,6 +6,4 @@ class EcommerceConfig(AppConfig):
     name = "ecommerce"
 
     def ready(self):
-        from paradedb.monkey_patch import patch_django_lookup
-
-        patch_django_lookup()
+        from . import signals  # noqa: F401
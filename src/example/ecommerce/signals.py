@@ -0,0 +1,23 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Product
+
+
+FACETS_VERSION_KEY = "facets:version"
+
+
+def get_facets_version():
+    return cache.get_or_set(FACETS_VERSION_KEY, 1, timeout=None)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_facets(sender, **kwargs):
+    # Bumping the version orphans every cached facet entry at once; the old
+    # entries simply expire.
+    try:
+        cache.incr(FACETS_VERSION_KEY)
+    except ValueError:
+        cache.set(FACETS_VERSION_KEY, 1, timeout=None)
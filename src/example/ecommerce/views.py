@@ -1,14 +1,79 @@
+import hashlib
+import json
 from datetime import datetime
 
-from django.core.paginator import Paginator
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.shortcuts import render
 
 from paradedb import aggregates
+from paradedb.aggregates import Facet
 from paradedb.cast import ValueCast
 from paradedb.lookups import LookupParameter
 
 from .models import Product
+from .signals import get_facets_version
+
+
+PAGE_SIZE = 25
+
+# Built once at import time; Django copies expressions when resolving them
+# into a query, so the same instances are safe to share across requests.
+_TOTAL_AGG = aggregates.Count("id")
+_CATEGORY_AGG = aggregates.Term("category", size=1000)
+_BRAND_AGG = aggregates.Term("brand", size=1000)
+_ATTR_AGG = aggregates.Term("product_details.key", size=500)
+
+FACETS_CACHE_TIMEOUT = 300
+
+# Query params that change the page or its order but not the result set.
+_NON_FILTER_PARAMS = frozenset({"after", "after_value", "sort"})
+
+
+# ``sort`` query param -> ordering applied ahead of the ``id`` tie-breaker.
+_SORTS = {
+    "new": "-created",
+    "old": "created",
+    "price_asc": "selling_price",
+    "price_desc": "-selling_price",
+    "rating_desc": "-average_rating",
+    "rating_asc": "average_rating",
+}
+
+
+def _clean_price(price):
+    if price:
+        return int(price.replace(",", "").replace("₹", ""))
+    return None
+
+
+def _clean_cursor(field_name, value):
+    if not value:
+        return None
+    try:
+        return Product._meta.get_field(field_name).to_python(value)
+    except ValidationError:
+        return None
+
+
+def _annotate_facets(queryset):
+    return queryset.annotate(
+        total_facet=Facet(_TOTAL_AGG),
+        category_facet=Facet(_CATEGORY_AGG),
+        brand_facet=Facet(_BRAND_AGG),
+        attribute_facet=Facet(_ATTR_AGG),
+    )
+
+
+def _facets_cache_key(request):
+    filters = sorted(
+        (key, value)
+        for key, value in request.GET.items()
+        if value and key not in _NON_FILTER_PARAMS
+    )
+    digest = hashlib.blake2b(json.dumps(filters).encode(), digest_size=16).hexdigest()
+    return f"facets:{get_facets_version()}:{digest}"
 
 
 def product_list_view(request):
@@ -30,15 +95,10 @@ def product_list_view(request):
     min_price = request.GET.get("min_price")
     max_price = request.GET.get("max_price")
 
-    def clean_price(price):
-        if price:
-            return int(price.replace(",", "").replace("₹", ""))
-        return None
-
     if min_price:
-        products = products.filter(selling_price__gte=clean_price(min_price))
+        products = products.filter(selling_price__gte=_clean_price(min_price))
     if max_price:
-        products = products.filter(selling_price__lte=clean_price(max_price))
+        products = products.filter(selling_price__lte=_clean_price(max_price))
 
     # Rating
     min_rating = request.GET.get("min_rating")
@@ -50,25 +110,21 @@ def product_list_view(request):
     end_date = request.GET.get("end_date")
 
     if start_date or end_date:
-        date_filter = [
-            "daterange",
-            start_date if start_date else None,
-            end_date if end_date else None,
-            "()",
-        ]
-        if start_date:
-            date_filter[1] = datetime.strptime(start_date, "%Y-%m-%d")
-        if end_date:
-            date_filter[2] = datetime.strptime(end_date, "%Y-%m-%d")
-
+        start = datetime.fromisoformat(start_date) if start_date else None
+        end = datetime.fromisoformat(end_date) if end_date else None
         products = products.filter(
-            created__pdb_range=LookupParameter(*date_filter, legacy=True)
+            created__pdb_range=LookupParameter(
+                "daterange", start, end, "()", legacy=True
+            )
         )
 
-    for attr in request.GET.get("attr", "").split(","):
-        if not attr:
-            continue
-        products = products.filter(product_details__contains=[{"key": attr}])
+    # Attribute filter: JSONB ``@>`` is set containment, so one predicate
+    # matches products that have every requested key.
+    attrs = [attr for attr in request.GET.get("attr", "").split(",") if attr]
+    if attrs:
+        products = products.filter(
+            product_details__contains=[{"key": attr} for attr in attrs]
+        )
 
     search = request.GET.get("search")
     if search:
@@ -77,37 +133,104 @@ def product_list_view(request):
             | models.Q(description__pdb_search=search)
         )
 
-    sort_by = request.GET.get("sort")
-    if sort_by:
-        if sort_by == "new":
-            products = products.order_by("-created")
-        elif sort_by == "old":
-            products = products.order_by("created")
-        elif sort_by == "price_asc":
-            products = products.order_by("selling_price")
-        elif sort_by == "price_desc":
-            products = products.order_by("-selling_price")
-        elif sort_by == "rating_desc":
-            products = products.order_by("-average_rating")
-        elif sort_by == "rating_asc":
-            products = products.order_by("average_rating")
-
-    counts = products.filter(id__all=True).aggregate(
-        catgeory_counts=aggregates.Term("category", size=1000),
-        brands=aggregates.Term("brand", size=1000),
-        attributes=aggregates.Term("product_details.key", size=10000),
+    ordering = _SORTS.get(request.GET.get("sort"))
+
+    # Facets describe the filtered result set, not the page, so keep the
+    # queryset from before the cursor is applied.
+    filtered = products
+
+    # ------------------- KEYSET PAGINATION --------------------
+
+    # The cursor is the last row of the previous page: its id and, when a
+    # sort is applied, its value for the sort column (id breaks ties). A
+    # malformed cursor is ignored and the first page is served.
+    after = _clean_cursor("id", request.GET.get("after"))
+    if ordering:
+        sort_field = ordering.lstrip("-")
+        after_value = _clean_cursor(sort_field, request.GET.get("after_value"))
+        if after_value is None:
+            after = None
+    if after is not None:
+        if ordering:
+            lookup = "lt" if ordering.startswith("-") else "gt"
+            products = products.filter(
+                models.Q(**{f"{sort_field}__{lookup}": after_value})
+                | models.Q(**{sort_field: after_value, "id__gt": after})
+            )
+        else:
+            products = products.filter(id__gt=after)
+
+    products = products.order_by(*([ordering] if ordering else []), "id")
+
+    # Only fetch the columns the list template renders (plus the sort and
+    # cursor columns); product_details in particular is a large JSON blob.
+    # The template never follows ``product.user``; if it starts to, add
+    # ``select_related("user")`` and the user columns here to avoid a query
+    # per row.
+    products = products.only(
+        "id",
+        "title",
+        "brand",
+        "description",
+        "selling_price",
+        "actual_price",
+        "average_rating",
+        "url",
+        "images",
+        "created",
     )
 
-    paginator = Paginator(products, 25)  # 25 items per page
-    page = request.GET.get("page")
-    products_page = paginator.get_page(page)
+    # ------------------- FACETS --------------------
+
+    # Facets depend only on the filters, so they are cached per filter set
+    # and skipped from the page query on a hit. A miss on the first page
+    # computes them as window aggregates (``OVER ()``) that ride along with
+    # the page rows; past the cursor the page only sees the remaining rows,
+    # so they come from a separate query on the uncursored result set.
+    facets_key = _facets_cache_key(request)
+    facets = cache.get(facets_key)
+    if facets is None and after is None:
+        products = _annotate_facets(products)
+
+    page = list(products[: PAGE_SIZE + 1])
+    has_next = len(page) > PAGE_SIZE
+    page = page[:PAGE_SIZE]
+
+    if facets is None:
+        if after is None:
+            first = page[0] if page else None
+        else:
+            first = _annotate_facets(filtered.only("id")).first()
+        facets = {
+            "categories": first.category_facet["buckets"] if first else [],
+            "brands": first.brand_facet["buckets"] if first else [],
+            "attributes": first.attribute_facet["buckets"] if first else [],
+            "count": first.total_facet["value"] if first else 0,
+        }
+        cache.set(facets_key, facets, FACETS_CACHE_TIMEOUT)
+
+    next_query = None
+    if has_next:
+        last = page[-1]
+        params = request.GET.copy()
+        params["after"] = last.id
+        if ordering:
+            params["after_value"] = getattr(last, ordering.lstrip("-"))
+        next_query = params.urlencode()
+
+    # Back to the first page with the same filters and sort.
+    first_query = None
+    if after is not None:
+        params = request.GET.copy()
+        params.pop("after", None)
+        params.pop("after_value", None)
+        first_query = params.urlencode()
 
     context = {
-        "products": products_page,
-        "categories": counts["catgeory_counts"]["buckets"],
-        "brands": counts["brands"]["buckets"],
-        "attributes": counts["attributes"]["buckets"],
-        "count": products.count(),
+        "products": page,
+        **facets,
+        "next_query": next_query,
+        "first_query": first_query,
     }
 
     return render(
@@ -1,93 +1,188 @@
+import io
 import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+import ijson
 from ecommerce.models import Product
 
-from django.db import transaction
+import django
+from django.contrib.postgres.fields import ArrayField
+from django.db import connection, models, transaction
 
 
-def import_products_from_json(file_path: str):
-    """
-    Import product JSON objects from a file into the Product table using bulk_create.
-    """
+CHUNK_SIZE = 1000
+
+# Strips the currency symbol, thousands separators and spaces in one pass.
+_PRICE_STRIP = str.maketrans("", "", "₹, ")
+
+# Backslash, tab, newline and carriage return are special in COPY's text format.
+_COPY_ESCAPE = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# First number in strings such as "69% off".
+_DISCOUNT_RE = re.compile(r"(\d+(?:\.\d+)?)")
 
-    # --------------------
-    # Load JSON
-    # --------------------
-    with open(file_path, "r") as f:
-        data = json.load(f)
 
+def _iter_items(f):
     # Allow both single object & list
-    if isinstance(data, dict):
-        data = [data]
-
-    products = []
-
-    for item in data:
-        crawled_at_val = item.get("crawled_at")
-        if crawled_at_val:
-            try:
-                crawled_at = datetime.strptime(crawled_at_val, "%d/%m/%Y, %H:%M:%S")
-            except ValueError:
-                crawled_at = None
-        else:
+    first = f.read(1)
+    while first.isspace():
+        first = f.read(1)
+    f.seek(0)
+    prefix = "" if first == b"{" else "item"
+    return ijson.items(f, prefix, use_float=True)
+
+
+def _iter_chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _product_kwargs(item) -> dict:
+    crawled_at_val = item.get("crawled_at")
+    if crawled_at_val:
+        try:
+            crawled_at = datetime.strptime(crawled_at_val, "%d/%m/%Y, %H:%M:%S")
+        except ValueError:
             crawled_at = None
+    else:
+        crawled_at = None
+
+    match = _DISCOUNT_RE.search(item.get("discount") or "")
+    discount = float(match.group(1)) if match else 0
+
+    selling_price = item.get("selling_price", "").translate(_PRICE_STRIP)
+    if selling_price.isdigit():
+        item["selling_price"] = int(selling_price)
+
+    actual_price = item.get("actual_price", "").translate(_PRICE_STRIP)
+    if actual_price.isdigit():
+        item["actual_price"] = int(actual_price)
+    else:
+        item["actual_price"] = item.get("selling_price", 0) or 0
+
+    product_details = []
+    for detail in item.get("product_details", []):
+        for key, value in detail.items():
+            product_details.append({"key": key, "value": value})
+
+    return dict(
+        id=item["_id"],
+        title=item.get("title", "No Title"),
+        brand=item.get("brand", "Unknown"),
+        category=item.get("category", "Unknown"),
+        sub_category=item.get("sub_category", "Unknown"),
+        description=item.get("description", ""),
+        actual_price=item.get("actual_price", 0) or 1,
+        selling_price=item.get("selling_price", 0) or 1,
+        discount=discount,
+        average_rating=(
+            float(item.get("average_rating")) if item.get("average_rating") else 0
+        ),
+        out_of_stock=bool(item.get("out_of_stock", False)),
+        url=item.get("url"),
+        images=item.get("images", []),
+        product_details=product_details,
+        created=crawled_at,
+    )
 
-        discount = [
-            d for d in item.get("discount", "").split("%") if d.strip().isdigit()
-        ]
-        if discount:
-            item["discount"] = float(discount[0])
 
-        selling_price = (
-            item.get("selling_price", "").replace("₹", "").replace(",", "").strip()
-        )
-        if selling_price.isdigit():
-            item["selling_price"] = int(selling_price)
+def _build_products(chunk) -> list[dict]:
+    # Runs in a worker process; returns plain kwargs because model instances
+    # do not pickle cheaply across processes.
+    return [_product_kwargs(item) for item in chunk]
+
+
+def _copy_text(field, value) -> str:
+    """Render a prepared field value in COPY's text format."""
 
-        actual_price = (
-            item.get("actual_price", "").replace("₹", "").replace(",", "").strip()
+    if value is None:
+        return "\\N"
+    if isinstance(field, models.JSONField):
+        text = json.dumps(value)
+    elif isinstance(field, ArrayField):
+        text = "{%s}" % ",".join(
+            '"%s"' % str(v).replace("\\", "\\\\").replace('"', '\\"') for v in value
         )
-        if actual_price.isdigit():
-            item["actual_price"] = int(actual_price)
-        else:
-            item["actual_price"] = item.get("selling_price", 0) or 0
-
-        product_details = []
-        for detail in item.get("product_details", []):
-            for key, value in detail.items():
-                product_details.append({"key": key, "value": value})
-
-        product = Product(
-            id=item["_id"],
-            title=item.get("title", "No Title"),
-            brand=item.get("brand", "Unknown"),
-            category=item.get("category", "Unknown"),
-            sub_category=item.get("sub_category", "Unknown"),
-            description=item.get("description", ""),
-            actual_price=item.get("actual_price", 0) or 1,
-            selling_price=item.get("selling_price", 0) or 1,
-            discount=float(item.get("discount")) if item.get("discount") else 0,
-            average_rating=(
-                float(item.get("average_rating")) if item.get("average_rating") else 0
-            ),
-            out_of_stock=bool(item.get("out_of_stock", False)),
-            url=item.get("url"),
-            images=item.get("images", []),
-            product_details=product_details,
-            created=crawled_at,
+    elif isinstance(value, bool):
+        text = "t" if value else "f"
+    elif isinstance(value, datetime):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return text.translate(_COPY_ESCAPE)
+
+
+def _insert_chunk(kwargs_list) -> int:
+    # COPY cannot skip conflicting rows, so rows are staged in a temp table
+    # and moved over with ON CONFLICT DO NOTHING (like ignore_conflicts).
+    fields = [Product._meta.get_field(name) for name in kwargs_list[0]]
+    buffer = io.StringIO()
+    for kwargs in kwargs_list:
+        buffer.write(
+            "\t".join(
+                _copy_text(field, field.get_prep_value(kwargs[field.name]))
+                for field in fields
+            )
         )
+        buffer.write("\n")
+    buffer.seek(0)
+
+    quote_name = connection.ops.quote_name
+    table = quote_name(Product._meta.db_table)
+    columns = ", ".join(quote_name(field.column) for field in fields)
+
+    # The staging table is dropped explicitly rather than ON COMMIT, so chunks
+    # still work when the import runs inside an outer atomic() block.
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE product_import (LIKE {table} INCLUDING DEFAULTS)"
+        )
+        # copy_expert is psycopg2 only; psycopg 3 uses cursor.copy() instead.
+        cursor.copy_expert(f"COPY product_import ({columns}) FROM STDIN", buffer)
+        cursor.execute(
+            f"INSERT INTO {table} SELECT * FROM product_import ON CONFLICT DO NOTHING"
+        )
+        cursor.execute("DROP TABLE product_import")
+    return len(kwargs_list)
+
+
+def import_products_from_json(file_path: str, max_workers: int = None):
+    """
+    Import product JSON objects from a file into the Product table using COPY.
+
+    The file is parsed incrementally in chunks of ``CHUNK_SIZE``. Worker
+    processes turn each chunk into Product kwargs while the main process
+    inserts finished chunks, each in its own transaction. Only a few chunks
+    are in flight at once, so memory does not grow with the file.
+    """
+
+    max_workers = max_workers or os.cpu_count() or 1
+    total = 0
+    pending = deque()
 
-        products.append(product)
+    with open(file_path, "rb") as f:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=django.setup
+        ) as executor:
+            for chunk in _iter_chunks(_iter_items(f), CHUNK_SIZE):
+                pending.append(executor.submit(_build_products, chunk))
+                if len(pending) >= max_workers * 2:
+                    total += _insert_chunk(pending.popleft().result())
 
-    # --------------------
-    # Bulk insert
-    # --------------------
-    if products:
-        with transaction.atomic():
-            Product.objects.bulk_create(products, batch_size=500)
+            while pending:
+                total += _insert_chunk(pending.popleft().result())
 
-    return f"Imported {len(products)} products successfully."
+    return f"Imported {total} products successfully."
 
 
 def run():
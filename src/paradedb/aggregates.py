@@ -1,6 +1,7 @@
 import datetime
 import json
 import typing
+from functools import cached_property
 
 from django.db import models
 from django.db.models.aggregates import Aggregate
@@ -36,18 +37,34 @@ class BaseAggregate(Aggregate):
     template = "%(function)s(%(expressions)s)"
     output_field = models.JSONField()
 
+    def build_json(self, as_dict=False):
+        if as_dict:
+            return self._json_dict
+
+        return self._json_str
+
+    def _build_json_dict(self) -> dict:
+        raise NotImplementedError
+
+    @cached_property
+    def _json_dict(self) -> dict:
+        # Aggregate parameters are fixed after __init__, so the payload is
+        # built and serialized at most once per instance.
+        return self._build_json_dict()
+
+    @cached_property
+    def _json_str(self) -> str:
+        return json.dumps(self._json_dict, separators=(",", ":"))
+
 
 class Count(BaseAggregate):
     def __init__(self, field: str = "id", *args, **kwargs):
-        self.pfield = field
+        self.pfield = str(field)
         super().__init__(models.Value(self.build_json()), *args, **kwargs)
 
-    def build_json(self, as_dict=False):
-        param_json = {"value_count": {"field": str(self.pfield)}}
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+    def _build_json_dict(self):
+        param_json = {"value_count": {"field": self.pfield}}
+        return param_json
 
 
 class TermAggregateOrder:
@@ -68,9 +85,10 @@ class TermAggregateOrder:
 
     @classmethod
     def from_dict(cls, d):
-        for key, value in d.items():
-            return TermAggregateOrder(key, value)
-        raise ValueError("Invalid dict")
+        if not d:
+            raise ValueError("Invalid dict")
+        key, value = next(iter(d.items()))
+        return cls(key, value)
 
 
 class Term(BaseAggregate):
@@ -80,7 +98,7 @@ class Term(BaseAggregate):
         order: typing.Optional[TermAggregateOrder | dict[str, str]] = None,
         size: int = 0,
         segment_size: int = 0,
-        min_doc_count: int = 0,
+        min_doc_count: int = 1,
         missing: typing.Optional[float | int] = None,
         show_term_doc_count_error: bool = False,
         aggs: typing.Optional[dict] = None,
@@ -90,7 +108,7 @@ class Term(BaseAggregate):
         if order is not None and not isinstance(order, (TermAggregateOrder, dict)):
             raise ValueError("order must be TermAggregateOrder or dict")
 
-        self.pfield = field
+        self.pfield = str(field)
 
         self.order = order
         if isinstance(order, dict):
@@ -98,14 +116,16 @@ class Term(BaseAggregate):
 
         self.size = size
         self.segment_size = segment_size
-        self.min_doc_count = min_doc_count
+        # 0 was the old "unset" sentinel; 1 (drop empty buckets) is also the
+        # Tantivy default, so it is left out of the payload.
+        self.min_doc_count = max(min_doc_count, 1)
         self.missing = missing
         self.show_term_doc_count_error = show_term_doc_count_error
         self.aggs = aggs
 
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         terms = {"field": self.pfield}
 
         if self.order is not None:
@@ -115,7 +135,7 @@ class Term(BaseAggregate):
             terms["size"] = self.size
         if self.segment_size > 0:
             terms["segment_size"] = self.segment_size
-        if self.min_doc_count > 0:
+        if self.min_doc_count > 1:
             terms["min_doc_count"] = self.min_doc_count
         if self.missing is not None:
             terms["missing"] = self.missing
@@ -127,10 +147,7 @@ class Term(BaseAggregate):
         if self.aggs is not None:
             res["aggs"] = self.aggs
 
-        if as_dict:
-            return res
-
-        return json.dumps(res)
+        return res
 
 
 class HistogramBound:
@@ -172,7 +189,7 @@ class DateHistogram(BaseAggregate):
         if extended_bounds and not hard_bounds:
             raise ValueError("Cannot set extended_bounds without hard_bounds.")
 
-        self.pfield = field
+        self.pfield = str(field)
         self.fixed_interval = fixed_interval
         self.offset = offset
         self.min_doc_count = min_doc_count
@@ -189,7 +206,7 @@ class DateHistogram(BaseAggregate):
 
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {
             "date_histogram": {
                 "field": self.pfield,
@@ -214,10 +231,7 @@ class DateHistogram(BaseAggregate):
         if self.keyed is not None:
             param_json["date_histogram"]["keyed"] = self.keyed
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Histogram(BaseAggregate):
@@ -246,7 +260,7 @@ class Histogram(BaseAggregate):
         if extended_bounds and not hard_bounds:
             raise ValueError("Cannot set extended_bounds without hard_bounds.")
 
-        self.pfield = field
+        self.pfield = str(field)
         self.interval = interval
         self.offset = offset
         self.min_doc_count = min_doc_count
@@ -264,7 +278,7 @@ class Histogram(BaseAggregate):
 
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {"histogram": {"field": self.pfield, "interval": self.interval}}
 
         if self.offset is not None:
@@ -287,10 +301,7 @@ class Histogram(BaseAggregate):
         if self.is_normalized_to_ns is not None:
             param_json["histogram"]["is_normalized_to_ns"] = self.is_normalized_to_ns
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class RangeAggegationRange:
@@ -332,12 +343,12 @@ class Range(BaseAggregate):
         *args,
         **extra,
     ):
-        self.pfield = field
+        self.pfield = str(field)
         self.ranges = ranges
         self.keyed = keyed
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {
             "range": {
                 "field": self.pfield,
@@ -347,10 +358,7 @@ class Range(BaseAggregate):
         if self.keyed is not None:
             param_json["range"]["keyed"] = self.keyed
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Avg(BaseAggregate):
@@ -361,19 +369,16 @@ class Avg(BaseAggregate):
         *args,
         **extra,
     ):
-        self.pfield = field
+        self.pfield = str(field)
         self.missing = missing
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {"avg": {"field": self.pfield}}
         if self.missing is not None:
             param_json["avg"]["missing"] = self.missing
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Cardinality(BaseAggregate):
@@ -384,19 +389,16 @@ class Cardinality(BaseAggregate):
         *args,
         **extra,
     ):
-        self.pfield = field
+        self.pfield = str(field)
         self.missing = missing
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {"cardinality": {"field": self.pfield}}
         if self.missing is not None:
             param_json["cardinality"]["missing"] = self.missing
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Min(BaseAggregate):
@@ -407,19 +409,16 @@ class Min(BaseAggregate):
         *args,
         **extra,
     ):
-        self.pfield = field
+        self.pfield = str(field)
         self.missing = missing
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {"min": {"field": self.pfield}}
         if self.missing is not None:
             param_json["min"]["missing"] = self.missing
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Max(BaseAggregate):
@@ -430,19 +429,16 @@ class Max(BaseAggregate):
         *args,
         **extra,
     ):
-        self.pfield = field
+        self.pfield = str(field)
         self.missing = missing
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {"max": {"field": self.pfield}}
         if self.missing is not None:
             param_json["max"]["missing"] = self.missing
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Percentile(BaseAggregate):
@@ -461,13 +457,13 @@ class Percentile(BaseAggregate):
         ):
             raise ValueError("percents must be a list of floats or ints")
 
-        self.pfield = field
+        self.pfield = str(field)
         self.percents = percents
         self.keyed = keyed
         self.missing = missing
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {"percentiles": {"field": self.pfield}}
         if self.percents is not None:
             param_json["percentiles"]["percents"] = self.percents
@@ -478,48 +474,39 @@ class Percentile(BaseAggregate):
         if self.missing is not None:
             param_json["percentiles"]["missing"] = self.missing
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Stats(BaseAggregate):
     def __init__(
         self, field: str, missing: typing.Optional[float | int] = None, *args, **extra
     ):
-        self.pfield = field
+        self.pfield = str(field)
         self.missing = missing
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {"stats": {"field": self.pfield}}
         if self.missing is not None:
             param_json["stats"]["missing"] = self.missing
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Sum(BaseAggregate):
     def __init__(
         self, field: str, missing: typing.Optional[float | int] = None, *args, **extra
     ):
-        self.pfield = field
+        self.pfield = str(field)
         self.missing = missing
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {"sum": {"field": self.pfield}}
         if self.missing is not None:
             param_json["sum"]["missing"] = self.missing
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class TopHitSort:
@@ -535,15 +522,10 @@ class TopHitSort:
 
     @classmethod
     def from_array_json(cls, array_json):
-        objs = []
-        for item in array_json:
-            if not isinstance(item, dict):
-                raise ValueError("Expected array of objects")
-
-            for key, value in item.items():
-                objs.append(cls(key, value))
+        if not all(isinstance(item, dict) for item in array_json):
+            raise ValueError("Expected array of objects")
 
-        return objs
+        return [cls(key, value) for item in array_json for key, value in item.items()]
 
 
 class TopHit(BaseAggregate):
@@ -576,7 +558,7 @@ class TopHit(BaseAggregate):
         self.docvalue_fields = docvalue_fields
         super().__init__(models.Value(self.build_json()), *args, **extra)
 
-    def build_json(self, as_dict=False):
+    def _build_json_dict(self):
         param_json = {
             "top_hits": {"sort": [s.to_json() for s in self.sort], "size": self.size}
         }
@@ -586,10 +568,7 @@ class TopHit(BaseAggregate):
         if self.docvalue_fields is not None:
             param_json["top_hits"]["docvalue_fields"] = self.docvalue_fields
 
-        if as_dict:
-            return param_json
-
-        return json.dumps(param_json)
+        return param_json
 
 
 class Facet(Expression):
@@ -605,7 +584,7 @@ class Facet(Expression):
         super().__init__(*args, output_field=models.JSONField(), **extra)
 
     def as_sql(self, compiler, connection, **extra_context):
-        sql = "{} OVER () ".format(
-            connection.ops.compose_sql(*self.aggregate.as_sql(compiler, connection))
-        )
-        return sql, []
+        # Pass the aggregate's params through rather than inlining them with
+        # compose_sql(); the driver binds them with the rest of the query.
+        sql, params = self.aggregate.as_sql(compiler, connection)
+        return "{} OVER () ".format(sql), params
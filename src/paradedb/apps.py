@@ -8,7 +8,5 @@ class ParadeDBConfig(AppConfig):
 
     def ready(self):
         from paradedb.lookups import ModelResolverFromTable
-        from paradedb.monkey_patch import patch_django_lookup
 
-        patch_django_lookup()
         ModelResolverFromTable.preload()
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import copy
 import datetime
+import functools
+import itertools
 import json
+import re
+import sys
 import typing
+import weakref
 
 from django.db import models
 from django.db.models.expressions import Expression
@@ -53,6 +59,15 @@ __all__ = [
 ParadeDbFunctionExpression: typing.TypeAlias = Expression
 
 
+@functools.lru_cache(maxsize=None)
+def _schema_for_version(version: str) -> str:
+    # Compare numerically so that e.g. "0.100" sorts after "0.20".
+    if tuple(int(part) for part in re.findall(r"\d+", version)[:2]) >= (0, 20):
+        return "pdb"
+
+    return "paradedb"
+
+
 def _get_schema(legacy=False, func=None):
     if legacy:
         return "paradedb"
@@ -63,16 +78,38 @@ def _get_schema(legacy=False, func=None):
     if settings.PARADEBD_USE_V2:
         return "pdb"
 
-    version = get_version()
+    return _schema_for_version(get_version())
 
-    if version >= "0.20":
-        return "pdb"
 
-    return "paradedb"
+_BOOL_SQL: dict[bool, str] = {True: "true", False: "false"}
+
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+# Shared default output field; like Django's own Exists, it is never mutated.
+_BOOL_FIELD = models.BooleanField()
 
 
-def _normalize_bool(value: bool) -> str:
-    return "true" if value else "false"
+def _intern(value):
+    # Field and key names are compared and hashed repeatedly while compiling.
+    return sys.intern(value) if value.__class__ is str else value
+
+
+_SEARCH_OPS = frozenset({"@@@", "|||", "===", "###", "&&&"})
+
+_MATCH_TOKENIZERS = frozenset(
+    {
+        "whitespace",
+        "keyword",
+        "ngram",
+        "regex",
+        "icu",
+        "jieba",
+        "chinese_lindera",
+        "chinese_compatible",
+        "source_code",
+        "raw",
+    }
+)
 
 
 def _resolve_field_name(
@@ -113,16 +150,26 @@ def _resolve_and_set_key_field(
     if isinstance(pfield, TableField):
         if field_name is not None:
             setattr(instance, field_name, pfield.field)
-        table, field = pfield.get_sql().split(".")
-        primary_key_field = pfield.get_table_primary_key_field() or field
+        primary_key_field = pfield.get_table_primary_key_field() or pfield.field
         setattr(
             instance,
             key_field_name,
-            KeyField(table=table, primary_key_field=primary_key_field),
+            KeyField(table=pfield.get_table(), primary_key_field=primary_key_field),
         )
 
 
+def _resolve_pfield(pfield: str | models.F | TableField, compiler) -> str:
+    if isinstance(pfield, models.F):
+        return resolve_f_model_and_field(pfield, compiler.query)[1]
+    if isinstance(pfield, TableField):
+        return pfield.field
+    return pfield
+
+
 def _resolve_value(value, connection, compiler):
+    # Plain scalars are by far the most common, so check them first.
+    if value.__class__ in _SCALAR_TYPES:
+        return value
     if isinstance(value, list):
         return postgres_array(value)
     if isinstance(value, models.Value):
@@ -133,14 +180,30 @@ def _resolve_value(value, connection, compiler):
     return value
 
 
+def _legacy_inner(expr):
+    # A copy in the legacy field-first form used inside paradedb.boolean(), so
+    # the caller's expression is never mutated.
+    expr = copy.copy(expr)
+    expr.legacy = True
+    expr.ignore_lhs = True
+    # Don't share the original's per-compiler cache with the copy.
+    expr.__dict__.pop("_prepared", None)
+    return expr
+
+
+def _compile_inner(exprs, compiler, connection):
+    # Compile nested queries into inline SQL.
+    compose_sql = connection.ops.compose_sql
+    return [compose_sql(*expr.as_sql(compiler, connection)) for expr in exprs]
+
+
 def _make_schema_sql(func, args, schema="paradedb", lhs=None, op="@@@", key_field=None):
+    call = "".join((schema, ".", func, "(", ",".join(args), ")"))
     if lhs:
-        sql = f"{lhs} {op} {schema}.{func}({','.join(args)})"
-    else:
-        sql = f"{schema}.{func}({','.join(args)})"
-        if key_field:
-            sql = f"{key_field} {op} {sql}"
-    return sql
+        return "".join((str(lhs), " ", op, " ", call))
+    if key_field:
+        return "".join((str(key_field), " ", op, " ", call))
+    return call
 
 
 class All(Expression):
@@ -151,12 +214,12 @@ class All(Expression):
         *args,
         **kwargs,
     ):
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.legacy = kwargs.pop("legacy", False)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
@@ -181,11 +244,11 @@ class Empty(Expression):
         *args,
         **kwargs,
     ):
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
@@ -213,11 +276,14 @@ class Search(Expression):
         *args,
         **kwargs,
     ):
-        if op not in ["@@@", "|||", "===", "###", "&&&"]:
+        if op not in _SEARCH_OPS:
             raise ValueError("op must be one of '@@@", "|||", "===", "###", "&&&'")
 
-        self.pfield = field
+        self.pfield = _intern(field)
         self.value = value if not escaped else escape_query(value)
+        self._array_sql = (
+            postgres_array(self.value) if isinstance(self.value, list) else None
+        )
         self.op = op
         self.escaped = escaped
         self.key_field = kwargs.pop("key_field", None)
@@ -225,13 +291,16 @@ class Search(Expression):
 
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
         sql = """{} {} """.format(_resolve_field_name(compiler, self.pfield), self.op)
 
+        if self.value.__class__ is str:
+            return sql + " %s", [self.value]
+
         if isinstance(self.value, (Expression, models.Func, ValueCast)):
             value_sql = connection.ops.compose_sql(
                 *self.value.as_sql(compiler, connection)
@@ -239,9 +308,8 @@ class Search(Expression):
             sql += value_sql
             return sql, []
 
-        if isinstance(self.value, list):
-            sql += " {}".format(postgres_array(self.value))
-            return sql, []
+        if self._array_sql is not None:
+            return sql + " " + self._array_sql, []
 
         sql += " %s"
 
@@ -251,7 +319,71 @@ class Search(Expression):
         return f"SimpleSearch({self.pfield}, {self.value})"
 
 
-class Match(Expression):
+class _SimplePredicate(Expression):
+    """
+    Base class for single-field ParadeDB predicates such as term() and match().
+    Subclasses set FUNC_NAME and return the args following the field.
+    """
+
+    FUNC_NAME = ""  # must be overridden in subclasses
+
+    def _predicate_args(self) -> tuple[list[str], list]:
+        raise NotImplementedError
+
+    def _prepare(self, compiler, connection) -> tuple[str, bool, str]:
+        # Resolve the key field and schema once per compiler. legacy and
+        # match_op change both, so they are part of the key.
+        prepared = self.__dict__.get("_prepared")
+        if prepared is None:
+            prepared = self._prepared = weakref.WeakKeyDictionary()
+        key = (self.legacy, self.match_op)
+        cached = prepared.get(compiler, {}).get(key)
+        if cached is not None:
+            return cached
+
+        # key_field is only rendered with match_op. Without it the field name
+        # is resolved locally, leaving an F() or TableField pfield in place
+        # for a later compile that does need the key field.
+        if self.match_op:
+            _resolve_and_set_key_field(self.pfield, self, connection, compiler)
+            field = self.pfield
+        else:
+            field = _resolve_pfield(self.pfield, compiler)
+        schema = _get_schema(self.legacy, func=self.FUNC_NAME)
+        cached = (schema, schema == "paradedb", field)
+        prepared.setdefault(compiler, {})[key] = cached
+        return cached
+
+    def as_sql(self, compiler, connection):
+        schema, include_field, field = self._prepare(compiler, connection)
+        args, params = self._predicate_args()
+
+        if include_field:
+            args = ["%s", *args]
+            params = [field, *params]
+
+        return (
+            _make_schema_sql(
+                func=self.FUNC_NAME,
+                args=args,
+                schema=schema,
+                lhs=field if not self.ignore_lhs and not include_field else None,
+                key_field=self.key_field if self.match_op else None,
+            ),
+            params,
+        )
+
+
+class Match(_SimplePredicate):
+    FUNC_NAME = "match"
+    _ARGS = (
+        " %s",
+        " conjunction_mode:=%s",
+        " transposition_cost_one:=%s",
+        " prefix:=%s",
+        "distance:=%s",
+    )
+
     def __init__(
         self,
         field: str | models.F | TableField,
@@ -286,19 +418,7 @@ class Match(Expression):
         if (
             tokenizer is not None
             and not isinstance(tokenizer, Tokenizer)
-            and tokenizer
-            not in [
-                "whitespace",
-                "keyword",
-                "ngram",
-                "regex",
-                "icu",
-                "jieba",
-                "chinese_lindera",
-                "chinese_compatible",
-                "source_code",
-                "raw",
-            ]
+            and tokenizer not in _MATCH_TOKENIZERS
         ):
             raise ValueError(
                 f"Invalid tokenizer: {tokenizer}. Must be one of ['whitespace',"
@@ -306,12 +426,12 @@ class Match(Expression):
                 " 'chinese_compatible', 'source_code', 'raw']"
             )
 
-        self.pfield = field
+        self.pfield = _intern(field)
         self.value = value
         self.distance = distance
         self.conjunction_mode = conjunction_mode
-        self.tokenizer = tokenizer
-        self.key_field = key_field
+        self.tokenizer = _intern(tokenizer)
+        self.key_field = _intern(key_field)
         self.prefix = prefix
         self.transposition_cost_one = transposition_cost_one
         self.escaped = escaped
@@ -321,33 +441,20 @@ class Match(Expression):
 
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
-
+    def _predicate_args(self):
         params = [
             self.value if not self.escaped else escape_query(self.value),
-            self.normalize_bool(self.conjunction_mode),
-            self.normalize_bool(self.transposition_cost_one),
-            self.normalize_bool(self.prefix),
+            _BOOL_SQL[bool(self.conjunction_mode)],
+            _BOOL_SQL[bool(self.transposition_cost_one)],
+            _BOOL_SQL[bool(self.prefix)],
             self.distance,
         ]
 
-        args = [
-            " %s",
-            " conjunction_mode:=%s",
-            " transposition_cost_one:=%s",
-            " prefix:=%s",
-            "distance:=%s",
-        ]
-
-        schema = _get_schema(self.legacy, func="match")
-        if include_field := schema == "paradedb":
-            args.insert(0, "%s")
-            params.insert(0, self.pfield)
+        args = list(self._ARGS)
 
         if self.tokenizer is not None:
             if isinstance(self.tokenizer, Tokenizer):
@@ -356,19 +463,10 @@ class Match(Expression):
                 args.append("tokenizer:=paradedb.tokenizer(%s)")
                 params.append(self.tokenizer)
 
-        return (
-            _make_schema_sql(
-                func="match",
-                args=args,
-                schema=schema,
-                lhs=self.pfield if not self.ignore_lhs and not include_field else None,
-                key_field=self.key_field if self.match_op else None,
-            ),
-            params,
-        )
+        return args, params
 
     def normalize_bool(self, value):
-        return "true" if value else "false"
+        return _BOOL_SQL[bool(value)]
 
     def __repr__(self):
         return (
@@ -387,15 +485,15 @@ class Exists(Expression):
         *args,
         **kwargs,
     ):
-        self.pfield = field
-        self.key_field = key_field
+        self.pfield = _intern(field)
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.ignore_lhs = kwargs.pop("ignore_lhs", False)
         self.legacy = kwargs.pop("legacy", False)
 
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
@@ -403,7 +501,7 @@ class Exists(Expression):
         _resolve_and_set_key_field(self.pfield, self, connection, compiler)
 
         params = [self.pfield] if self.pfield else []
-        sql = """paradedb.exists(%s)""" if self.pfield else """pdb.exists()"""
+        sql = "paradedb.exists(%s)" if self.pfield else "pdb.exists()"
         if self.match_op:
             sql = f"{self.key_field} @@@ {sql}"
         return sql, params
@@ -412,7 +510,9 @@ class Exists(Expression):
         return f"Exists(field={self.field}, key_field={self.key_field})"
 
 
-class Range(Expression):
+class Range(_SimplePredicate):
+    FUNC_NAME = "range"
+
     class RangeType:
         INT4RANGE = "int4range"
         INT8RANGE = "int8range"
@@ -421,6 +521,7 @@ class Range(Expression):
         TSTZRANGE = "tstzrange"
 
         all = [INT4RANGE, INT8RANGE, DATERANGE, TSRANGE, TSTZRANGE]
+        _all = frozenset(all)
 
     class RangeBound:
         INCLUSIVE_LOWER_EXCLUSIVE_UPPER = "[)"
@@ -434,6 +535,7 @@ class Range(Expression):
             INCLUSIVE_BOTH,
             EXCLUSIVE_BOTH,
         ]
+        _all = frozenset(all)
 
     def __init__(
         self,
@@ -451,66 +553,64 @@ class Range(Expression):
         *args,
         **kwargs,
     ):
-        self.pfield = field
+        self.pfield = _intern(field)
         self.range_type = self._validate_range_type(range_type)
         self.start = start
         self.end = end
         self.bounds = self._validate_bound(bounds)
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.ignore_lhs = kwargs.pop("ignore_lhs", False)
         self.legacy = kwargs.pop("legacy", False)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
-
-        params = []
+    def _predicate_args(self):
         args = [
-            "range:= {}".format(
-                self.make_range(self.range_type, self.start, self.end, self.bounds)
-            )
+            "range:= "
+            + self.make_range(self.range_type, self.start, self.end, self.bounds)
         ]
-
-        schema = _get_schema(self.legacy, func="range")
-
-        if include_field := schema == "paradedb":
-            params.insert(0, self.pfield)
-            args.insert(0, "%s")
-
-        return (
-            _make_schema_sql(
-                func="range",
-                args=args,
-                schema=schema,
-                lhs=self.pfield if not self.ignore_lhs and not include_field else None,
-                key_field=self.key_field if self.match_op else None,
-            ),
-            params,
-        )
+        return args, []
 
     def make_range(self, range_type, start, end, bounds):
-        return f"{range_type}({self._format(start)}, {self._format(end)}, '{bounds}')"
+        return "".join(
+            (
+                range_type,
+                "(",
+                self._format(start),
+                ", ",
+                self._format(end),
+                ", '",
+                bounds,
+                "')",
+            )
+        )
 
     @classmethod
     def _format(self, value):
         if value is None:
             return "NULL"
         elif isinstance(value, datetime.datetime):
-            return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+            return "'%04d-%02d-%02d %02d:%02d:%02d'" % (
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+            )
         elif isinstance(value, datetime.date):
-            return f"'{value.strftime('%Y-%m-%d')}'"
+            return "'" + value.isoformat() + "'"
         elif isinstance(value, str):
             return f"'{value}'"
         else:
             return str(value)
 
     def _validate_range_type(self, range_type):
-        if range_type not in Range.RangeType.all:
+        if range_type not in Range.RangeType._all:
             raise ValueError(
                 f"Invalid range type: {range_type}. Must be one of"
                 f" {Range.RangeType.all}"
@@ -518,7 +618,7 @@ class Range(Expression):
         return range_type
 
     def _validate_bound(self, bounds):
-        if bounds not in Range.RangeBound.all:
+        if bounds not in Range.RangeBound._all:
             raise ValueError(
                 f"Invalid bounds: {bounds}. Must be one of {Range.RangeBound.all}"
             )
@@ -532,13 +632,16 @@ class Range(Expression):
         )
 
 
-class RangeTerm(Expression):
+class RangeTerm(_SimplePredicate):
+    FUNC_NAME = "range_term"
+
     class Relation:
         Intersects = "Intersects"
         Within = "Within"
         Contains = "Contains"
 
         all = [Intersects, Within, Contains]
+        _all = frozenset(all)
 
     class Cast:
         tsrange = "tsrange"
@@ -577,6 +680,7 @@ class RangeTerm(Expression):
             tstzrange,
             numrange,
         ]
+        _all = frozenset(all)
 
     def __init__(
         self,
@@ -608,54 +712,37 @@ class RangeTerm(Expression):
         *args,
         **kwargs,
     ):
-        if relation is not None and relation not in RangeTerm.Relation.all:
+        if relation is not None and relation not in RangeTerm.Relation._all:
             raise ValueError(
                 f"Invalid relation: {relation}. Must be one of {RangeTerm.Relation.all}"
             )
 
-        if cast not in RangeTerm.Cast.all:
+        if cast not in RangeTerm.Cast._all:
             raise ValueError(
                 f"Invalid cast: {cast}. Must be one of {RangeTerm.Cast.all}"
             )
 
-        self.pfield = field
+        self.pfield = _intern(field)
         self.term_range = term_or_range
         self.cast = cast
         self.relation = relation
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.ignore_lhs = kwargs.pop("ignore_lhs", False)
         self.legacy = kwargs.pop("legacy", False)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
-
-        schema = _get_schema(self.legacy, func="range_term")
-        params = []
-        args = ["{}::{}".format(self.term_range, self.cast)]
-
-        if include_field := schema == "paradedb":
-            params.insert(0, self.pfield)
-            args.insert(0, "%s")
+    def _predicate_args(self):
+        args = ["".join((str(self.term_range), "::", self.cast))]
 
         if self.relation is not None:
             args.append(f"'{self.relation}'")
 
-        return (
-            _make_schema_sql(
-                func="range_term",
-                args=args,
-                schema=schema,
-                lhs=self.pfield if not self.ignore_lhs and not include_field else None,
-                key_field=self.key_field if self.match_op else None,
-            ),
-            params,
-        )
+        return args, []
 
     def __repr__(self):
         return (
@@ -664,7 +751,9 @@ class RangeTerm(Expression):
         )
 
 
-class Regex(Expression):
+class Regex(_SimplePredicate):
+    FUNC_NAME = "regex"
+
     def __init__(
         self,
         field: str | models.F | TableField,
@@ -674,39 +763,20 @@ class Regex(Expression):
         *args,
         **kwargs,
     ):
-        self.pfield = field
+        self.pfield = _intern(field)
         self.value = value
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.ignore_lhs = kwargs.pop("ignore_lhs", False)
         self.legacy = kwargs.pop("legacy", False)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
-
-        schema = _get_schema(self.legacy, func="regex")
-        params = [self.value]
-        args = ["%s"]
-
-        if include_field := schema == "paradedb":
-            args.insert(0, "%s")
-            params.insert(0, self.pfield)
-
-        return (
-            _make_schema_sql(
-                func="regex",
-                args=args,
-                schema=schema,
-                lhs=self.pfield if not self.ignore_lhs and not include_field else None,
-                key_field=self.key_field if self.match_op else None,
-            ),
-            params,
-        )
+    def _predicate_args(self):
+        return ["%s"], [self.value]
 
     def __repr__(self):
         return (
@@ -714,7 +784,9 @@ class Regex(Expression):
         )
 
 
-class Term(Expression):
+class Term(_SimplePredicate):
+    FUNC_NAME = "term"
+
     def __init__(
         self,
         field: str | models.F | TableField,
@@ -725,47 +797,33 @@ class Term(Expression):
         *args,
         **kwargs,
     ):
-        self.pfield = field
+        self.pfield = _intern(field)
         self.value = value
         self.enum_cast_field = enum_cast_field
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.ignore_lhs = kwargs.pop("ignore_lhs", False)
         self.legacy = kwargs.pop("legacy", False)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
-
-        schema = _get_schema(self.legacy, func="term")
-        args = []
-        params = []
-
-        if include_field := schema == "paradedb":
-            params.append(self.pfield)
-            args.append("%s")
-
+    def _predicate_args(self):
         if self.enum_cast_field:
-            args.append("%s::{}".format(self.enum_cast_field))
-        else:
-            args.append("%s")
+            return ["%s::" + self.enum_cast_field], [self.value]
+        return ["%s"], [self.value]
 
-        params.append(self.value)
-
-        return (
-            _make_schema_sql(
-                func="term",
-                args=args,
-                schema=schema,
-                lhs=self.pfield if not self.ignore_lhs and not include_field else None,
-                key_field=self.key_field if self.match_op else None,
-            ),
-            params,
-        )
+    def _render_term_set_fragment(self, compiler):
+        # TermSet always nests the legacy, field-first form of term().
+        field = _resolve_pfield(self.pfield, compiler)
+        if self.enum_cast_field:
+            return "paradedb.term(%s,%s::" + self.enum_cast_field + ")", [
+                field,
+                self.value,
+            ]
+        return "paradedb.term(%s,%s)", [field, self.value]
 
     def __repr__(self):
         return (
@@ -784,26 +842,25 @@ class TermSet(Expression):
         **kwargs,
     ):
         self.terms = terms
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
         terms_sql = []
+        params = []
         for term in self.terms:
-            term.ignore_lhs = True
-            term.legacy = True
-            terms_sql.append(
-                connection.ops.compose_sql(*term.as_sql(compiler, connection))
-            )
-        sql = """paradedb.term_set(terms := ARRAY[{}])""".format(", ".join(terms_sql))
+            term_sql, term_params = term._render_term_set_fragment(compiler)
+            terms_sql.append(term_sql)
+            params.extend(term_params)
+        sql = "paradedb.term_set(terms := ARRAY[" + ", ".join(terms_sql) + "])"
         if self.match_op:
             sql = f"{self.key_field} @@@ {sql}"
-        return sql, []
+        return sql, params
 
     def __repr__(self):
         return (
@@ -812,7 +869,10 @@ class TermSet(Expression):
         )
 
 
-class FuzzyTerm(Expression):
+class FuzzyTerm(_SimplePredicate):
+    FUNC_NAME = "fuzzy_term"
+    _ARGS = ("%s", "transposition_cost_one:=%s", "prefix:=%s", "distance:=%s")
+
     def __init__(
         self,
         field: str | models.F | TableField,
@@ -825,47 +885,29 @@ class FuzzyTerm(Expression):
         *args,
         **kwargs,
     ):
-        self.pfield = field
+        self.pfield = _intern(field)
         self.value = value
         self.distance = distance
         self.transposition_cost_one = transposition_cost_one
         self.prefix = prefix
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.ignore_lhs = kwargs.pop("ignore_lhs", False)
         self.legacy = kwargs.pop("legacy", False)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
-
+    def _predicate_args(self):
         params = [
             self.value,
-            _normalize_bool(self.transposition_cost_one),
-            _normalize_bool(self.prefix),
+            _BOOL_SQL[bool(self.transposition_cost_one)],
+            _BOOL_SQL[bool(self.prefix)],
             self.distance,
         ]
-        args = ["%s", "transposition_cost_one:=%s", "prefix:=%s", "distance:=%s"]
-        schema = _get_schema(self.legacy, func="fuzzy_term")
-
-        if include_field := schema == "paradedb":
-            args.insert(0, "%s")
-            params.insert(0, self.pfield)
-
-        return (
-            _make_schema_sql(
-                func="fuzzy_term",
-                args=args,
-                schema=schema,
-                lhs=self.pfield if not self.ignore_lhs and not include_field else None,
-                key_field=self.key_field if self.match_op else None,
-            ),
-            params,
-        )
+        return list(self._ARGS), params
 
     def __repr__(self):
         return (
@@ -874,7 +916,9 @@ class FuzzyTerm(Expression):
         )
 
 
-class Phrase(Expression):
+class Phrase(_SimplePredicate):
+    FUNC_NAME = "phrase"
+
     def __init__(
         self,
         field: str | models.F | TableField,
@@ -888,44 +932,27 @@ class Phrase(Expression):
 
         assert len(pharses) > 1, "Phrase must have more than one phrase"
 
-        self.pfield = field
-        self.pharses = pharses
+        self.pfield = _intern(field)
+        self.pharses = tuple(pharses)
+        self._pharses_sql = postgres_array(self.pharses)
 
         try:
             self.slop = int(slop)
         except (TypeError, ValueError):
             raise ValueError("slop must be an integer")
 
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.ignore_lhs = kwargs.pop("ignore_lhs", False)
         self.legacy = kwargs.pop("legacy", False)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
-
-        schema = _get_schema(self.legacy, func="phrase")
-        args = ["{}".format(postgres_array(self.pharses)), "%s"]
-        params = [self.slop]
-        if include_field := schema == "paradedb":
-            args.insert(0, "%s")
-            params.insert(0, self.pfield)
-
-        return (
-            _make_schema_sql(
-                func="phrase",
-                args=args,
-                schema=schema,
-                lhs=self.pfield if not self.ignore_lhs and not include_field else None,
-                key_field=self.key_field if self.match_op else None,
-            ),
-            params,
-        )
+    def _predicate_args(self):
+        return [self._pharses_sql, "%s"], [self.slop]
 
     def __repr__(self):
         return (
@@ -934,7 +961,9 @@ class Phrase(Expression):
         )
 
 
-class PhrasePrefix(Expression):
+class PhrasePrefix(_SimplePredicate):
+    FUNC_NAME = "phrase_prefix"
+
     def __init__(
         self,
         field: str | models.F | TableField,
@@ -946,44 +975,29 @@ class PhrasePrefix(Expression):
         **kwargs,
     ):
         assert len(pharses) > 1, "Phrase must have more than one phrase"
-        self.pfield = field
-        self.pharses = pharses
+        self.pfield = _intern(field)
+        self.pharses = tuple(pharses)
+        self._pharses_sql = postgres_array(self.pharses)
         self.max_expansion = max_expansion
-        self.key_field = key_field
+        self.key_field = _intern(key_field)
         self.match_op = match_op
         self.ignore_lhs = kwargs.pop("ignore_lhs", False)
         self.legacy = kwargs.pop("legacy", False)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
-
-        schema = _get_schema(self.legacy, func="phrase_prefix")
+    def _predicate_args(self):
+        args = [self._pharses_sql]
         params = []
-        args = ["{}".format(postgres_array(self.pharses))]
 
         if self.max_expansion != 0:
             args.append("max_expansion:=%s")
             params.append(self.max_expansion)
 
-        if include_field := schema == "paradedb":
-            args.insert(0, "%s")
-            params.insert(0, self.pfield)
-
-        return (
-            _make_schema_sql(
-                func="phrase_prefix",
-                args=args,
-                schema=schema,
-                lhs=self.pfield if not self.ignore_lhs and not include_field else None,
-                key_field=self.key_field if self.match_op else None,
-            ),
-            params,
-        )
+        return args, params
 
     def __repr__(self):
         return (
@@ -1008,7 +1022,7 @@ class ConstScore(Expression):
         self.match_op = match_op
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
@@ -1092,24 +1106,20 @@ class DisjunctionMax(Expression):
 
         self.disjuncts = disjuncts
         self.tie_breaker = tie_breaker
+        self._skeleton = (
+            f"paradedb.disjunction_max(ARRAY[{{}}], tie_breaker:={tie_breaker})"
+        )
         self.key_field = key_field
         self.match_op = match_op
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
-        inner_queries = [
-            connection.ops.compose_sql(*q.as_sql(compiler, connection))
-            for q in self.disjuncts
-        ]
-        query_sql = ", ".join(inner_queries)
-        sql = (
-            f"paradedb.disjunction_max(ARRAY[{query_sql}],"
-            f" tie_breaker:={self.tie_breaker})"
-        )
+        inner_queries = _compile_inner(self.disjuncts, compiler, connection)
+        sql = self._skeleton.format(", ".join(inner_queries))
         if self.match_op:
             sql = f"{self.key_field} @@@ {sql}"
 
@@ -1120,6 +1130,22 @@ class DisjunctionMax(Expression):
 
 
 class Boolean(Expression):
+    # Keyed by a must/must_not/should bitmask of the non-empty clauses.
+    _TEMPLATES = {
+        0b001: "paradedb.boolean(should := ARRAY[{should}])",
+        0b010: "paradedb.boolean(must_not := ARRAY[{must_not}])",
+        0b011: (
+            "paradedb.boolean(must_not := ARRAY[{must_not}], should := ARRAY[{should}])"
+        ),
+        0b100: "paradedb.boolean(must := ARRAY[{must}])",
+        0b101: "paradedb.boolean(must := ARRAY[{must}], should := ARRAY[{should}])",
+        0b110: "paradedb.boolean(must := ARRAY[{must}], must_not := ARRAY[{must_not}])",
+        0b111: (
+            "paradedb.boolean(must := ARRAY[{must}], must_not := ARRAY[{must_not}],"
+            " should := ARRAY[{should}])"
+        ),
+    }
+
     def __init__(
         self,
         must: typing.Optional[typing.List[ParadeDbFunctionExpression]] = None,
@@ -1146,52 +1172,32 @@ class Boolean(Expression):
         self.must = must
         self.must_not = must_not
         self.should = should
+        self._must = [_legacy_inner(q) for q in must or ()]
+        self._must_not = [_legacy_inner(q) for q in must_not or ()]
+        self._should = [_legacy_inner(q) for q in should or ()]
         self.key_field = key_field
         self.match_op = match_op
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
-        must_inner_sqls = []
-        must_not_inner_sqls = []
-        should_inner_sqls = []
-
-        for q in self.must or []:
-            q.ignore_lhs = True
-            q.legacy = True
-            must_inner_sqls.append(
-                connection.ops.compose_sql(*q.as_sql(compiler, connection))
-            )
-
-        for q in self.must_not or []:
-            q.ignore_lhs = True
-            q.legacy = True
-            must_not_inner_sqls.append(
-                connection.ops.compose_sql(*q.as_sql(compiler, connection))
-            )
-
-        for q in self.should or []:
-            q.ignore_lhs = True
-            q.legacy = True
-            should_inner_sqls.append(
-                connection.ops.compose_sql(*q.as_sql(compiler, connection))
-            )
-
-        param_sqls_array = []
-        if must_inner_sqls:
-            must_sql = ", ".join(must_inner_sqls)
-            param_sqls_array.append(f"must := ARRAY[{must_sql}]")
-        if must_not_inner_sqls:
-            must_not_sql = ", ".join(must_not_inner_sqls)
-            param_sqls_array.append(f"must_not := ARRAY[{must_not_sql}]")
-        if should_inner_sqls:
-            should_sql = ", ".join(should_inner_sqls)
-            param_sqls_array.append(f"should := ARRAY[{should_sql}]")
-
-        sql = f"paradedb.boolean({', '.join(param_sqls_array)})"
+        must_inner_sqls = _compile_inner(self._must, compiler, connection)
+        must_not_inner_sqls = _compile_inner(self._must_not, compiler, connection)
+        should_inner_sqls = _compile_inner(self._should, compiler, connection)
+
+        mask = (
+            bool(must_inner_sqls) << 2
+            | bool(must_not_inner_sqls) << 1
+            | bool(should_inner_sqls)
+        )
+        sql = self._TEMPLATES[mask].format(
+            must=", ".join(must_inner_sqls),
+            must_not=", ".join(must_not_inner_sqls),
+            should=", ".join(should_inner_sqls),
+        )
         if self.match_op:
             sql = f"{self.key_field} @@@ {sql}"
         return sql, []
@@ -1202,6 +1208,21 @@ class Boolean(Expression):
         )
 
 
+_SNIPPET_OPTIONS = (
+    '"limit":=%s',
+    '"offset":=%s',
+    "start_tag:=%s",
+    "end_tag:=%s",
+    "max_num_chars:=%s",
+)
+
+# Optional argument SQL for every combination of the snippet options being set.
+_SNIPPET_TEMPLATES = {
+    mask: "".join(", " + option for option, on in zip(_SNIPPET_OPTIONS, mask) if on)
+    for mask in itertools.product((False, True), repeat=len(_SNIPPET_OPTIONS))
+}
+
+
 class Snippet(Expression):
     def __init__(
         self,
@@ -1231,30 +1252,16 @@ class Snippet(Expression):
     def as_sql(self, compiler, connection):
         _resolve_and_set_key_field(self.pfield, self, connection, compiler)
 
-        sql = f"pdb.snippet({self.pfield} "
-        params = []
-
-        if self.limit is not None:
-            sql += ', "limit":=%s'
-            params.append(self.limit)
-
-        if self.offset is not None:
-            sql += ', "offset":=%s'
-            params.append(self.offset)
-
-        if self.start_tag is not None:
-            sql += ", start_tag:=%s"
-            params.append(self.start_tag)
-
-        if self.end_tag is not None:
-            sql += ", end_tag:=%s"
-            params.append(self.end_tag)
-
-        if self.max_num_chars is not None:
-            sql += ", max_num_chars:=%s"
-            params.append(self.max_num_chars)
-
-        sql += ")"
+        values = (
+            self.limit,
+            self.offset,
+            self.start_tag,
+            self.end_tag,
+            self.max_num_chars,
+        )
+        options = _SNIPPET_TEMPLATES[tuple(value is not None for value in values)]
+        sql = f"pdb.snippet({self.pfield} {options})"
+        params = [value for value in values if value is not None]
 
         if self.match_op:
             sql = f"{self.key_field} @@@ {sql}"
@@ -1269,6 +1276,16 @@ class Snippet(Expression):
 
 
 class MoreLikeThis(Expression):
+    _OPTIONAL = (
+        ("min_doc_frequency", "min_doc_frequency :=%s"),
+        ("max_doc_frequency", "max_doc_frequency :=%s"),
+        ("min_term_frequency", "min_term_frequency :=%s"),
+        ("max_query_terms", "max_query_terms :=%s"),
+        ("min_word_length", "min_word_length :=%s"),
+        ("max_word_length", "max_word_length :=%s"),
+        ("boost_factor", "boost_factor :=%s"),
+    )
+
     def __init__(
         self,
         document_id: typing.Optional[str | int] = None,
@@ -1291,7 +1308,7 @@ class MoreLikeThis(Expression):
             assert isinstance(document, dict), "document must be a dict"
         self.document_id = document_id
         self.document = document
-        self.fields = fields
+        self.fields = tuple(fields) if fields else None
         self.min_doc_frequency = min_doc_frequency
         self.max_doc_frequency = max_doc_frequency
         self.min_term_frequency = min_term_frequency
@@ -1299,53 +1316,40 @@ class MoreLikeThis(Expression):
         self.min_word_length = min_word_length
         self.max_word_length = max_word_length
         self.boost_factor = boost_factor
-        self.stop_words = stop_words
+        self.stop_words = tuple(stop_words) if stop_words else None
         self.key_field = key_field
         self.match_op = match_op
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
+        parts = []
         params = []
-        sql = """pdb.more_like_this("""
         if self.document_id:
-            sql += "key_value :=%s"
+            parts.append("key_value :=%s")
             params.append(self.document_id)
             if self.fields:
-                sql += ", fields := {}".format(postgres_array(self.fields))
+                parts.append("fields := %s::text[]")
+                params.append(list(self.fields))
 
         if self.document and not self.document_id:
-            sql += "document :=%s"
+            parts.append("document :=%s")
             params.append(json.dumps(self.document))
 
-        if self.min_doc_frequency:
-            sql += ", min_doc_frequency :=%s"
-            params.append(self.min_doc_frequency)
-        if self.max_doc_frequency:
-            sql += ", max_doc_frequency :=%s"
-            params.append(self.max_doc_frequency)
-        if self.min_term_frequency:
-            sql += ", min_term_frequency :=%s"
-            params.append(self.min_term_frequency)
-        if self.max_query_terms:
-            sql += ", max_query_terms :=%s"
-            params.append(self.max_query_terms)
-        if self.min_word_length:
-            sql += ", min_word_length :=%s"
-            params.append(self.min_word_length)
-        if self.max_word_length:
-            sql += ", max_word_length :=%s"
-            params.append(self.max_word_length)
-        if self.boost_factor:
-            sql += ", boost_factor :=%s"
-            params.append(self.boost_factor)
+        for attr, clause in self._OPTIONAL:
+            value = getattr(self, attr)
+            if value:
+                parts.append(clause)
+                params.append(value)
+
         if self.stop_words:
-            sql += ", stopwords:= {}".format(postgres_array(self.stop_words))
+            parts.append("stopwords:= %s::text[]")
+            params.append(list(self.stop_words))
 
-        sql += ")"
+        sql = "pdb.more_like_this(" + ", ".join(parts) + ")"
         if self.match_op:
             sql = f"{self.key_field} @@@ {sql}"
         return sql, params
@@ -1364,6 +1368,11 @@ class MoreLikeThis(Expression):
 
 
 class Parse(Expression):
+    _TEMPLATES = {
+        schema: f"{schema}.parse(%s, lenient:=%s, conjunction_mode:=%s)"
+        for schema in ("pdb", "paradedb")
+    }
+
     def __init__(
         self,
         query: str,
@@ -1380,22 +1389,22 @@ class Parse(Expression):
         self.key_field = key_field
         self.match_op = match_op
         self.legacy = kwargs.pop("legacy", False)
+        self._params = (
+            query,
+            _BOOL_SQL[bool(lenient)],
+            _BOOL_SQL[bool(conjunction_mode)],
+        )
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
-        schema = _get_schema(self.legacy, func="parse")
-        sql = f"{schema}.parse(%s, lenient:=%s, conjunction_mode:=%s)"
+        sql = self._TEMPLATES[_get_schema(self.legacy, func="parse")]
         if self.match_op:
             sql = f"{self.key_field} @@@ {sql}"
-        return sql, [
-            self.query,
-            _normalize_bool(self.lenient),
-            _normalize_bool(self.conjunction_mode),
-        ]
+        return sql, self._params
 
     def __repr__(self):
         return (
@@ -1405,6 +1414,8 @@ class Parse(Expression):
 
 
 class ParseWithField(Expression):
+    _SQL = "paradedb.parse_with_field(%s, %s, lenient:=%s, conjunction_mode:=%s)"
+
     def __init__(
         self,
         field: str | models.F | TableField,
@@ -1422,24 +1433,31 @@ class ParseWithField(Expression):
         self.conjunction_mode = conjunction_mode
         self.key_field = key_field
         self.match_op = match_op
+        # Plain field names need no per-query resolution, so bind params once.
+        self._params = self._build_params() if field.__class__ is str else None
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
+    def _build_params(self):
+        return (
+            self.pfield,
+            self.value,
+            _BOOL_SQL[bool(self.lenient)],
+            _BOOL_SQL[bool(self.conjunction_mode)],
+        )
+
     def as_sql(self, compiler, connection):
-        _resolve_and_set_key_field(self.pfield, self, connection, compiler)
+        if (params := self._params) is None:
+            _resolve_and_set_key_field(self.pfield, self, connection, compiler)
+            params = self._build_params()
 
-        sql = "paradedb.parse_with_field(%s, %s, lenient:=%s, conjunction_mode:=%s)"
+        sql = self._SQL
         if self.match_op:
             sql = f"{self.key_field} @@@ {sql}"
-        return sql, [
-            self.pfield,
-            self.value,
-            _normalize_bool(self.lenient),
-            _normalize_bool(self.conjunction_mode),
-        ]
+        return sql, params
 
     def __repr__(self):
         return (
@@ -1464,27 +1482,23 @@ class ProximityRegex(Expression):
         self.max_expansions = max_expansions
         self.wrap = wrap
         self.key_field = kwargs.pop("key_field", None)
+        if max_expansions:
+            self._sql = "pdb.prox_regex(%s, %s)"
+            self._params = (regex, max_expansions)
+        else:
+            self._sql = "pdb.prox_regex(%s)"
+            self._params = (regex,)
+        self._wrapped_sql = "(" + self._sql + ")"
 
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
-        params = [self.regex]
-        sql = "pdb.prox_regex(%s"
-
-        if self.max_expansions:
-            sql += ", %s"
-            params.append(self.max_expansions)
-
-        sql += ")"
-
-        if self.wrap:
-            sql = f"({sql})"
-
-        return sql, params
+        # wrap is left to as_sql since Proximity turns it off on nested values.
+        return (self._wrapped_sql if self.wrap else self._sql), self._params
 
     def __repr__(self):
         return f"ProximityRegex({self.regex}, max_expansions={self.max_expansions})"
@@ -1502,24 +1516,30 @@ class ProximityArray(Expression):
         self.values = values
         self.wrap = wrap
         self.key_field = kwargs.pop("key_field", None)
+        self._sql_parts = tuple(
+            value if isinstance(value, ProximityRegex) else "%s" for value in values
+        )
+        self._dynamic = tuple(
+            idx for idx, value in enumerate(values) if isinstance(value, ProximityRegex)
+        )
+        self._params = tuple(
+            value for value in values if not isinstance(value, ProximityRegex)
+        )
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
-        params = []
-        sql_build = []
-        for value in self.values:
-            if isinstance(value, ProximityRegex):
-                query = connection.ops.compose_sql(*value.as_sql(compiler, connection))
-                sql_build.append(query)
-            else:
-                sql_build.append("%s")
-                params.append(value)
+        sql_build = list(self._sql_parts)
+        for idx in self._dynamic:
+            sql_build[idx] = connection.ops.compose_sql(
+                *sql_build[idx].as_sql(compiler, connection)
+            )
 
-        sql = "pdb.prox_array({})".format(", ".join(sql_build))
+        sql = "pdb.prox_array(" + ", ".join(sql_build) + ")"
+        params = list(self._params)
 
         if self.wrap:
             sql = f"({sql})"
@@ -1549,19 +1569,23 @@ class Proximity(Expression):
         self.values = values
         self.pfield = field
         self.key_field = kwargs.pop("key_field", None)
+        self._sql_parts, self._dynamic, self._params = self._build(values)
         super().__init__(
             *args,
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
-    def as_sql(self, compiler, connection, **extra_context):
-        sql_build = []
+    def _build(self, values):
+        # Validate once and split into static SQL, the positions of nested
+        # expressions (compiled per query) and the literal params.
+        sql_parts = []
+        dynamic = []
         params = []
 
         check = "value"
 
-        for idx, v in enumerate(self.values):
+        for idx, v in enumerate(values):
             check_op = idx % 2 == 1
             if check_op:
                 if v not in self.ops:
@@ -1571,18 +1595,15 @@ class Proximity(Expression):
                         )
                     )
 
-                sql_build.append(v)
+                sql_parts.append(v)
                 continue
 
             if check == "value":
                 if isinstance(v, (ProximityRegex, ProximityArray)):
-                    if hasattr(v, "wrap"):
-                        v.wrap = False
-
-                    sql = connection.ops.compose_sql(*v.as_sql(compiler, connection))
-                    sql_build.append(sql)
+                    dynamic.append(len(sql_parts))
+                    sql_parts.append(v)
                 else:
-                    sql_build.append("%s")
+                    sql_parts.append("%s")
                     params.append(v)
 
             if check == "distance":
@@ -1591,12 +1612,25 @@ class Proximity(Expression):
                         "Expected int at position {}. got '{}'".format(idx + 1, v)
                     )
 
-                sql_build.append("%s")
+                sql_parts.append("%s")
                 params.append(int(v))
 
             check = "distance" if check == "value" else "value"
 
-        sql = "({})".format(" ".join(sql_build))
+        return tuple(sql_parts), tuple(dynamic), tuple(params)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql_build = list(self._sql_parts)
+        params = list(self._params)
+
+        for idx in self._dynamic:
+            value = sql_build[idx]
+            value.wrap = False
+            sql_build[idx] = connection.ops.compose_sql(
+                *value.as_sql(compiler, connection)
+            )
+
+        sql = "(" + " ".join(sql_build) + ")"
 
         if self.pfield:
             sql = f"{_resolve_field_name(compiler, self.pfield)} @@@ {sql}"
@@ -1607,6 +1641,11 @@ class Proximity(Expression):
         return f"Proximity(values={self.values}, field={self.pfield})"
 
 
+@functools.lru_cache(maxsize=2048)
+def _json_access_suffix(keys: tuple) -> str:
+    return "".join(f"['{key}']" for key in keys)
+
+
 class JsonOp(Expression):
     def __init__(
         self, field: str, *keys: str, value: str | int | models.Value, **kwargs
@@ -1614,22 +1653,19 @@ class JsonOp(Expression):
         self.pfield = field
         self.keys = keys
         self.value = value
+        self._access_suffix = self.build_key(keys)
         super().__init__(
-            output_field=kwargs.pop("output_field", models.BooleanField()),
+            output_field=kwargs.pop("output_field", _BOOL_FIELD),
             **kwargs,
         )
 
     def as_sql(self, compiler, connection):
         _resolve_and_set_key_field(self.pfield, self, connection, compiler)
 
-        access_key = f"{self.pfield}{self.build_key(self.keys)}"
-        return f"{access_key} @@@ %s", [
+        return f"{self.pfield}{self._access_suffix} @@@ %s", [
             _resolve_value(self.value, connection, compiler)
         ]
 
     @classmethod
     def build_key(self, keys):
-        native_python_dict_access_ke_string = []
-        for key in keys:
-            native_python_dict_access_ke_string.append("['{}']".format(key))
-        return "".join(native_python_dict_access_ke_string)
+        return _json_access_suffix(tuple(keys))
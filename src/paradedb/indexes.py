@@ -1,5 +1,7 @@
 import json
 import typing
+import weakref
+from functools import cached_property
 
 from django.db import models
 from django.db.models import Expression, F
@@ -51,7 +53,7 @@ class TextFieldIndexConfig:
         self.fieldnorms = fieldnorms
         self.column = column
 
-    @property
+    @cached_property
     def json(self) -> dict[str, typing.Any]:
         field_config = {
             "fast": self.fast,
@@ -94,11 +96,9 @@ class JSONFieldIndexConfig(TextFieldIndexConfig):
         )
         self.expand_dots = expand_dots
 
-    @property
+    @cached_property
     def json(self):
-        config = super().json
-        config["expand_dots"] = self.expand_dots
-        return config
+        return {**super().json, "expand_dots": self.expand_dots}
 
 
 @deconstructible
@@ -115,7 +115,7 @@ class NumericFieldIndexConfig:
         self.indexed = indexed
         self.column = column
 
-    @property
+    @cached_property
     def json(self):
         config = {"fast": self.fast, "indexed": self.indexed}
         if self.column:
@@ -137,7 +137,7 @@ class BooleanFieldIndexConfig:
         self.indexed = indexed
         self.column = column
 
-    @property
+    @cached_property
     def json(self):
         config = {"fast": self.fast, "indexed": self.indexed}
         if self.column:
@@ -159,7 +159,7 @@ class DateTimeFieldIndexConfig:
         self.indexed = indexed
         self.column = column
 
-    @property
+    @cached_property
     def json(self):
         config = {"fast": self.fast, "indexed": self.indexed}
         if self.column:
@@ -184,6 +184,10 @@ class IndexFieldConfig:
         self.datetime_fields = datetime_fields or []
 
 
+# Per-query memo of resolved F() index columns, keyed on the F() name.
+_RESOLVED_INDEX_FIELDS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
 @deconstructible
 class IndexField(Expression):
     def __init__(
@@ -197,33 +201,29 @@ class IndexField(Expression):
         self.index_field = field
         self.tokenizer_cast = tokenizer_cast
         self.field_resolver = field_resolver
+        self._cast_sql = ""
+        if tokenizer_cast:
+            self._cast_sql = "::" + tokenizer_cast.removeprefix("::")
         super().__init__(*args, **kwargs)
 
     def as_sql(self, compiler, connection):
-        if isinstance(self.index_field, F) and not self.field_resolver:
-            resolved = self.index_field.resolve_expression(compiler.query)
-            self.index_field = resolved.target.column.__str__()
-
-        elif (
-            hasattr(self.index_field, "resolve_expression") and not self.field_resolver
-        ):
-            resolved = self.index_field.resolve_expression(compiler.query)
-            self.index_field = resolved.as_sql(compiler, connection)[0]
-
-        elif self.field_resolver:
-            self.index_field = self.field_resolver(
-                self.index_field, compiler, connection
-            )
+        index_field = self.index_field
+        if self.field_resolver:
+            index_field = self.field_resolver(index_field, compiler, connection)
 
-        if self.tokenizer_cast:
-            if self.tokenizer_cast.startswith("::"):
-                self.tokenizer_cast = self.tokenizer_cast[2:]
+        elif isinstance(index_field, F):
+            cache = _RESOLVED_INDEX_FIELDS.setdefault(compiler.query, {})
+            column = cache.get(index_field.name)
+            if column is None:
+                resolved = index_field.resolve_expression(compiler.query)
+                column = cache[index_field.name] = resolved.target.column.__str__()
+            index_field = column
 
-            sql = f"({self.index_field}::{self.tokenizer_cast})"
-        else:
-            sql = f"({self.index_field})"
+        elif hasattr(index_field, "resolve_expression"):
+            resolved = index_field.resolve_expression(compiler.query)
+            index_field = resolved.as_sql(compiler, connection)[0]
 
-        return sql, []
+        return f"({index_field}{self._cast_sql})", []
 
     def __repr__(self):
         return f"IndexField({self.index_field}, {self.tokenizer_cast})"
@@ -231,6 +231,13 @@ class IndexField(Expression):
 
 class Bm25Index(models.Index):
     suffix = "bm25"
+    _FIELD_GROUPS = (
+        "text_fields",
+        "json_fields",
+        "numeric_fields",
+        "boolean_fields",
+        "datetime_fields",
+    )
 
     def __init__(
         self,
@@ -303,52 +310,26 @@ class Bm25Index(models.Index):
             expressions=expressions,
             **kwargs,
         )
-        with_parts = [
-            "key_field={}".format(
-                self.key_field
-                or getattr(model, "paradedb_key_field", model._meta.pk.name)
-            ),
-        ]
-        for field, value in (self.with_extra or {}).items():
-            with_parts.append("{}={}".format(field, value))
+        key_field = self.key_field or getattr(
+            model, "paradedb_key_field", model._meta.pk.name
+        )
+        with_parts = [f"key_field={key_field}"]
+        if self.with_extra:
+            with_parts += [
+                f"{field}={value}" for field, value in self.with_extra.items()
+            ]
 
         if self.fields_config:
 
             def _to_json_string(configs: typing.List[TextFieldIndexConfig]):
                 return json.dumps({c.field: c.json for c in configs})
 
-            if self.fields_config.text_fields:
-                with_parts.append(
-                    "text_fields='{}'".format(
-                        _to_json_string(self.fields_config.text_fields)
-                    )
-                )
-            if self.fields_config.json_fields:
-                with_parts.append(
-                    "json_fields='{}'".format(
-                        _to_json_string(self.fields_config.json_fields)
-                    )
-                )
-            if self.fields_config.numeric_fields:
-                with_parts.append(
-                    "numeric_fields='{}'".format(
-                        _to_json_string(self.fields_config.numeric_fields)
-                    )
-                )
-            if self.fields_config.boolean_fields:
-                with_parts.append(
-                    "boolean_fields='{}'".format(
-                        _to_json_string(self.fields_config.boolean_fields)
-                    )
-                )
-            if self.fields_config.datetime_fields:
-                with_parts.append(
-                    "datetime_fields='{}'".format(
-                        _to_json_string(self.fields_config.datetime_fields)
-                    )
-                )
-
-        statement.parts["extra"] = " WITH ({})".format(", ".join(with_parts))
+            for group in self._FIELD_GROUPS:
+                configs = getattr(self.fields_config, group)
+                if configs:
+                    with_parts.append(f"{group}='{_to_json_string(configs)}'")
+
+        statement.parts["extra"] = f" WITH ({', '.join(with_parts)})"
         return statement
 
     def deconstruct(self):
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.apps import apps
 from django.db import models
 from django.db.models import (
@@ -77,20 +79,54 @@ __all__ = [
 ]
 
 
+_LOOKUP_FIELDS = (ForeignKey, ManyToManyField, OneToOneField, Field, CharField)
+
+# Registrations made while this module is importing; installed in one batch at
+# the end so Django's lookup cache is cleared once rather than per registration.
+_pending_lookups = []
+
+
 def register_lookup_for_all_fields(lookup_cls, extra_fields=None):
-    for f in [ForeignKey, ManyToManyField, OneToOneField, Field, CharField]:
-        f.register_lookup(lookup_cls)
-    for f in extra_fields or []:
-        f.register_lookup(lookup_cls)
+    fields = _LOOKUP_FIELDS + tuple(extra_fields or ())
+    if _pending_lookups is None:
+        for f in fields:
+            f.register_lookup(lookup_cls)
+    else:
+        _pending_lookups.append((lookup_cls, fields))
     return lookup_cls
 
 
+def _install_pending_lookups():
+    global _pending_lookups
+    pending, _pending_lookups = _pending_lookups, None
+    for lookup_cls, fields in pending:
+        for f in fields:
+            # Same bookkeeping as register_lookup, minus the cache clear.
+            if "class_lookups" not in f.__dict__:
+                f.class_lookups = {}
+            f.class_lookups[lookup_cls.lookup_name] = lookup_cls
+    # Django < 4.2 names this _clear_cached_lookups. Every registered field
+    # subclasses Field, so clearing from Field covers them all.
+    clear_cached_lookups = (
+        getattr(Field, "_clear_cached_class_lookups", None)
+        or Field._clear_cached_lookups
+    )
+    clear_cached_lookups()
+
+
 class ModelNotFoundError(Exception):
     pass
 
 
+def _model_key_field(model) -> str:
+    if hasattr(model, "paradedb_key_field"):
+        return model.paradedb_key_field
+    return model._meta.pk.name or "id"
+
+
 class ModelResolverFromTable:
     _model_cache = {}
+    _key_field_cache = {}
 
     @classmethod
     def resolve_model(cls, table: str):
@@ -99,11 +135,18 @@ class ModelResolverFromTable:
 
         raise ModelNotFoundError(f"Could not resolve model for table ({table})")
 
+    @classmethod
+    def key_field_name(cls, model) -> str:
+        name = cls._key_field_cache.get(model)
+        if name is None:
+            name = cls._key_field_cache[model] = _model_key_field(model)
+        return name
+
     @classmethod
     def preload(cls):
-        for app in apps.get_app_configs():
-            for model in app.get_models():
-                cls._model_cache[model._meta.db_table] = model
+        models_ = [m for app in apps.get_app_configs() for m in app.get_models()]
+        cls._model_cache = {m._meta.db_table: m for m in models_}
+        cls._key_field_cache = {m: _model_key_field(m) for m in models_}
 
 
 class LookupParameter:
@@ -120,6 +163,40 @@ class LookupParameter:
         return f"LookupParameter(args={self.args}, kwargs={self.kwargs})"
 
 
+def _parse_lhs(lhs: str, alias_map) -> tuple[str, str, str] | None:
+    """Split a compiled ``"alias"."column"`` LHS into (table, alias, column)."""
+    alias, dot, field = lhs.replace('"', "").partition(".")
+    if not dot or "." in field:
+        return None
+    join = alias_map.get(alias)
+    return (join.table_name if join is not None else alias), alias, field
+
+
+_PARAM_BUILDERS = {
+    LookupParameter: lambda value: value,
+    list: lambda value: LookupParameter(*value),
+    tuple: lambda value: LookupParameter(*value),
+    dict: lambda value: LookupParameter(**value),
+}
+
+
+def _to_lookup_parameter(value) -> LookupParameter:
+    builder = _PARAM_BUILDERS.get(value.__class__)
+    if builder is not None:
+        return builder(value)
+
+    # Subclasses of the builder types take the same shape as their base.
+    if isinstance(value, ValueCast):
+        return LookupParameter(value)
+    if isinstance(value, LookupParameter):
+        return value
+    if isinstance(value, (list, tuple)):
+        return LookupParameter(*value)
+    if isinstance(value, dict):
+        return LookupParameter(**value)
+    return LookupParameter(value)
+
+
 class ExpressionLookup(Lookup):
     """
     Base class for all ParadeDB lookups.
@@ -131,83 +208,60 @@ class ExpressionLookup(Lookup):
     exclude_field_in_expression = False
     exclude_args = False
     extra_param_kwargs = None
+    set_match_op = True
+    post_process = False
+    skip_prep = False
+
+    def __init__(self, lhs, rhs, *args, **kwargs):
+        # Keep the raw RHS; expression constructors need it before prep/adaptation.
+        self.rhs_original = rhs
+        super().__init__(lhs, rhs, *args, **kwargs)
+
+    def _resolve_alias(self, lhs: str, query):
+        """Return (model, alias, field) for a compiled LHS."""
+        parsed = _parse_lhs(lhs, query.alias_map)
+        if parsed is not None:
+            table, alias, field = parsed
+            model = ModelResolverFromTable._model_cache.get(table)
+            if model is not None:
+                if self.include_column_with_table_name:
+                    field = f"{alias}.{field}"
+                return model, alias, field
+            if settings.PARADEDB_RAISE_ON_MODEL_NOT_FOUND:
+                raise ModelNotFoundError(f"Could not resolve model for table ({table})")
+
+        model = query.model
+        return model, model._meta.db_table, lhs
 
     def as_sql(self, compiler, connection):
         lhs, lhs_params = self.process_lhs(compiler, connection)
+        model, alias, field = self._resolve_alias(lhs, compiler.query)
 
-        try:
-            rhs, rhs_params = self.process_rhs(compiler, connection)
-        except Exception:
-            rhs, rhs_params = None, ()
-
-        alias_map = compiler.query.alias_map
-
-        try:
-            alias, field = lhs.replace('"', "").split(".")
-            table = alias
-            if alias in alias_map:
-                table = alias_map[alias].table_name
-            model = ModelResolverFromTable.resolve_model(table)
-            if self.include_column_with_table_name:
-                field = f"{alias}.{field}"
-        except Exception as e:
-            if (
-                isinstance(e, ModelNotFoundError)
-                and settings.PARADEDB_RAISE_ON_MODEL_NOT_FOUND
-            ):
-                raise e
-
-            model = compiler.query.model
-            table = model._meta.db_table
-            alias = table
-            field = lhs
-
-        value = getattr(self, "rhs_original", rhs or rhs_params)
-
-        if isinstance(value, ValueCast):
-            params = LookupParameter(value)
-
-        elif isinstance(value, LookupParameter):
-            params = value
-
-        elif isinstance(value, (list, tuple)):
-            params = LookupParameter(*value)
-
-        elif isinstance(value, dict):
-            params = LookupParameter(**value)
-
-        else:
-            params = LookupParameter(value)
+        params = _to_lookup_parameter(self.rhs_original)
+        kwargs = params.kwargs
 
         if self.extra_param_kwargs:
             assert isinstance(
                 self.extra_param_kwargs, dict
             ), "extra_param_kwargs must be a dict"
-            params.kwargs.update(self.extra_param_kwargs or {})
-
-        if "key_field" not in params.kwargs:
-            if hasattr(model, "paradedb_key_field"):
-                primary_key_field = getattr(model, "paradedb_key_field")
-            else:
-                primary_key_field = model._meta.pk.name or "id"
+            kwargs.update(self.extra_param_kwargs)
 
-            params.kwargs["key_field"] = KeyField(
-                table=alias, primary_key_field=primary_key_field
+        if "key_field" not in kwargs:
+            kwargs["key_field"] = KeyField(
+                table=alias,
+                primary_key_field=ModelResolverFromTable.key_field_name(model),
             )
 
+        args = () if self.exclude_args else params.args
         if self.exclude_field_in_expression:
-            expr = self.expr_class(
-                *(params.args if not self.exclude_args else []), **params.kwargs
-            )
+            expr = self.expr_class(*args, **kwargs)
         else:
-            expr = self.expr_class(
-                field, *(params.args if not self.exclude_args else []), **params.kwargs
-            )
+            expr = self.expr_class(field, *args, **kwargs)
 
-        if hasattr(expr, "match_op"):
-            expr.match_op = params.kwargs.pop("match_op", True)
+        if self.set_match_op:
+            expr.match_op = kwargs.pop("match_op", True)
 
-        if hasattr(self, "post_process_expression"):
+        if self.post_process:
             processed = self.post_process_expression(expr, field)
             if processed and isinstance(processed, expr):
                 expr = processed
@@ -215,7 +269,7 @@ class ExpressionLookup(Lookup):
         return expr.as_sql(compiler, connection)
 
     def get_prep_lookup(self):
-        if self.lookup_name in (settings.PARADEDB_LOOKUP_SKIP_RHS_PREP or []):
+        if self.skip_prep or self.lookup_name in settings.PARADEDB_LOOKUP_SKIP_RHS_PREP:
             return self.rhs
         return super().get_prep_lookup()
 
@@ -226,9 +280,7 @@ class AllLookup(ExpressionLookup):
     expr_class = All
     exclude_field_in_expression = True
     exclude_args = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
@@ -237,20 +289,17 @@ class EmptyLookup(ExpressionLookup):
     expr_class = Empty
     exclude_field_in_expression = True
     exclude_args = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
 class SearchLookup(ExpressionLookup):
     lookup_name = "pdb_search"
     expr_class = Search
+    set_match_op = False
     include_column_with_table_name = True
     extra_param_kwargs = {"op": "@@@"}
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
@@ -264,27 +313,21 @@ class ExistsLookup(ExpressionLookup):
     lookup_name = "pdb_exists"
     expr_class = Exists
     exclude_args = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
 class RangeLookup(ExpressionLookup):
     lookup_name = "pdb_range"
     expr_class = Range
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
 class RangeTermLookup(ExpressionLookup):
     lookup_name = "range_term"
     expr_class = RangeTerm
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
@@ -304,9 +347,7 @@ class TermSetLookup(ExpressionLookup):
     lookup_name = "term_set"
     expr_class = TermSet
     exclude_field_in_expression = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
@@ -332,9 +373,7 @@ class ConstScoreLookup(ExpressionLookup):
     lookup_name = "const_score"
     expr_class = ConstScore
     exclude_field_in_expression = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
@@ -342,19 +381,16 @@ class BoostLookup(ExpressionLookup):
     lookup_name = "boost"
     expr_class = Boost
     exclude_field_in_expression = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
 class Bm25ScoreLookup(ExpressionLookup):
     lookup_name = "bm25_score"
     expr_class = Bm25Score
+    set_match_op = False
     exclude_field_in_expression = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
@@ -362,9 +398,7 @@ class DisjunctionMaxLookup(ExpressionLookup):
     lookup_name = "disjunction_max"
     expr_class = DisjunctionMax
     exclude_field_in_expression = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
@@ -372,9 +406,7 @@ class BooleanLookup(ExpressionLookup):
     lookup_name = "boolean"
     expr_class = Boolean
     exclude_field_in_expression = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
@@ -382,36 +414,34 @@ class MoreLikeThisLookup(ExpressionLookup):
     lookup_name = "more_like_this"
     expr_class = MoreLikeThis
     exclude_field_in_expression = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
 class ParseWithFieldLookup(ExpressionLookup):
     lookup_name = "parse_with_field"
     expr_class = ParseWithField
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
 class ParseLookup(ExpressionLookup):
     lookup_name = "parse"
     expr_class = Parse
-
-    def get_prep_lookup(self):
-        return self.rhs
+    skip_prep = True
 
 
 @register_lookup_for_all_fields
 class SnippetLookup(ExpressionLookup):
     lookup_name = "snippet"
     expr_class = Snippet
+    skip_prep = True
 
-    def get_prep_lookup(self):
-        return self.rhs
+
+@lru_cache(maxsize=None)
+def _related_ref(rel_model) -> str:
+    rel_pk = getattr(rel_model, "paradedb_key_field", rel_model._meta.pk.column)
+    return f"{rel_model._meta.db_table}.{rel_pk}"
 
 
 @register_lookup_for_all_fields
@@ -420,12 +450,7 @@ class RelatedTableTransform(models.Transform):
 
     def as_sql(self, compiler, connection):
         lhs_sql, lhs_params = compiler.compile(self.lhs)
-        rel_field = self.lhs.field
-        rel_model = rel_field.related_model
-        rel_table = rel_model._meta.db_table
-        rel_pk = getattr(rel_model, "paradedb_key_field", rel_model._meta.pk.column)
-        sql = f"{rel_table}.{rel_pk}"
-        return sql, lhs_params
+        return _related_ref(self.lhs.field.related_model), lhs_params
 
 
 # V2 lookup
@@ -458,9 +483,9 @@ class ProximityLookup(ExpressionLookup):
     lookup_name = "proximity"
     expr_class = Proximity
     exclude_field_in_expression = True
-
-    def get_prep_lookup(self):
-        return self.rhs
+    set_match_op = False
+    post_process = True
+    skip_prep = True
 
     def post_process_expression(self, expression, field):
         assert field is not None, "field cannot be None"
@@ -483,3 +508,4 @@ class JsonOpLookup(models.Lookup):
 
 
 register_lookup_for_all_fields(JsonOpLookup, extra_fields=[models.JSONField])
+_install_pending_lookups()
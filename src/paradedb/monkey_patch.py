@@ -1,11 +1,10 @@
-def patch_django_lookup():
-    from django.db.models.lookups import Lookup
-
-    original_init = Lookup.__init__
+import warnings
 
-    def init(self, lhs, rhs, *args, **kwargs):
-        self.rhs_original = rhs
-        original_init(self, lhs, rhs, *args, **kwargs)
 
-    Lookup.__init__ = init
-    Lookup._parade_patched = True
+def patch_django_lookup():
+    warnings.warn(
+        "patch_django_lookup() is a no-op; ExpressionLookup keeps the raw RHS"
+        " itself and Django's Lookup is no longer patched.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
@@ -1,14 +1,19 @@
-from functools import cache
-
-from django.db import connection
+from django.db import DEFAULT_DB_ALIAS, connections
 
 
 __all__ = ["get_version"]
 
 
-@cache
-def get_version():
-    with connection.cursor() as cursor:
-        cursor.execute("SELECT * FROM paradedb.version_info();")
-        res = cursor.fetchone()[0]
-    return res
+_VERSION_CACHE: dict[tuple[str, str], str] = {}
+
+
+def get_version(using: str = DEFAULT_DB_ALIAS) -> str:
+    conn = connections[using]
+    key = (conn.alias, conn.settings_dict["NAME"])
+    version = _VERSION_CACHE.get(key)
+    if version is None:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT * FROM paradedb.version_info();")
+            version = cursor.fetchone()[0]
+        _VERSION_CACHE[key] = version
+    return version
@@ -1,4 +1,5 @@
 import typing
+from functools import cached_property
 
 from django.utils.deconstruct import deconstructible
 
@@ -49,6 +50,7 @@ class StemmerLanguage:
         TAMIL,
         TURKISH,
     ]
+    _ALL = frozenset(ALL)
 
 
 class StopWordLanguage:
@@ -87,11 +89,20 @@ class StopWordLanguage:
         SPANISH,
         SWEDISH,
     ]
+    _ALL = frozenset(ALL)
 
 
 @deconstructible
 class Tokenizer:
     name = None
+    _CONFIG_FIELDS = (
+        "stemmer",
+        "remove_long",
+        "lowercase",
+        "stopwords_language",
+        "stopwords",
+        "ascii_folding",
+    )
 
     def __init__(
         self,
@@ -102,14 +113,14 @@ class Tokenizer:
         stopwords: typing.Optional[typing.List[str]] = None,
         ascii_folding: typing.Optional[bool] = None,
     ):
-        if stemmer is not None and stemmer not in StemmerLanguage.ALL:
+        if stemmer is not None and stemmer not in StemmerLanguage._ALL:
             raise ValueError(
                 f"Invalid stemmer: {stemmer}. Must be one of {StemmerLanguage.ALL}"
             )
 
         if (
             stopwords_language is not None
-            and stopwords_language not in StopWordLanguage.ALL
+            and stopwords_language not in StopWordLanguage._ALL
         ):
             raise ValueError(
                 f"Invalid stopwords_language: {stopwords_language}. Must be one of"
@@ -131,45 +142,18 @@ class Tokenizer:
         raise NotImplementedError
 
     def default_config(self):
-        config = {}
-        if self.stemmer is not None:
-            config["stemmer"] = self.stemmer
-        if self.remove_long is not None:
-            config["remove_long"] = self.remove_long
-        if self.lowercase is not None:
-            config["lowercase"] = self.lowercase
-        if self.stopwords_language is not None:
-            config["stopwords_language"] = self.stopwords_language
-        if self.stopwords is not None:
-            config["stopwords"] = self.stopwords
-        if self.ascii_folding is not None:
-            config["ascii_folding"] = self.ascii_folding
-        return config
+        return {
+            key: value
+            for key in self._CONFIG_FIELDS
+            if (value := getattr(self, key)) is not None
+        }
 
 
 @deconstructible
 class DefaultTokenizer(Tokenizer):
     name = "default"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -178,25 +162,7 @@ class DefaultTokenizer(Tokenizer):
 class WhitespaceTokenizer(Tokenizer):
     name = "whitespace"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -205,25 +171,7 @@ class WhitespaceTokenizer(Tokenizer):
 class RawTokenizer(Tokenizer):
     name = "raw"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -232,25 +180,7 @@ class RawTokenizer(Tokenizer):
 class KeyWordTokenizer(Tokenizer):
     name = "keyword"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -259,25 +189,7 @@ class KeyWordTokenizer(Tokenizer):
 class SourceCodeTokenizer(Tokenizer):
     name = "source_code"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -286,25 +198,7 @@ class SourceCodeTokenizer(Tokenizer):
 class ChineseCompatibleTokenizer(Tokenizer):
     name = "chinese_compatible"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -313,25 +207,7 @@ class ChineseCompatibleTokenizer(Tokenizer):
 class LinderaTokenizer(Tokenizer):
     name = "chinese_lindera"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -340,25 +216,7 @@ class LinderaTokenizer(Tokenizer):
 class JiebaTokenizer(Tokenizer):
     name = "jieba"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -367,25 +225,7 @@ class JiebaTokenizer(Tokenizer):
 class ICUTokenizer(Tokenizer):
     name = "icu"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
 
@@ -414,7 +254,7 @@ class RegexTokenizer(Tokenizer):
         )
         self.pattern = pattern
 
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, "pattern": self.pattern, **self.default_config()}
 
@@ -438,7 +278,7 @@ class NGramTokenizer(Tokenizer):
         self.max_gram = max_gram
         self.prefix_only = prefix_only
 
-    @property
+    @cached_property
     def json(self):
         return {
             "type": self.name,
@@ -453,24 +293,6 @@ class NGramTokenizer(Tokenizer):
 class LiteralTokenizer(Tokenizer):
     name = "literal"
 
-    def __init__(
-        self,
-        stemmer: typing.Optional[str] = None,
-        remove_long: typing.Optional[int] = None,
-        lowercase: typing.Optional[bool] = None,
-        stopwords_language: typing.Optional[str] = None,
-        stopwords: typing.Optional[typing.List[str]] = None,
-        ascii_folding: typing.Optional[bool] = None,
-    ):
-        super().__init__(
-            stemmer,
-            remove_long,
-            lowercase,
-            stopwords_language,
-            stopwords,
-            ascii_folding,
-        )
-
-    @property
+    @cached_property
     def json(self):
         return {"type": self.name, **self.default_config()}
@@ -1,5 +1,5 @@
-import re
 import typing
+import weakref
 
 from django.db import models
 from django.db.models.expressions import Col
@@ -20,31 +20,30 @@ class KeyField:
         self.table = table
         self.primary_key_field = primary_key_field
 
+        # The table never changes, so resolve the rendered names up front.
+        if hasattr(table, "_meta"):
+            self._db_table = table._meta.db_table
+        else:
+            self._db_table = table
+        if hasattr(table, "paradedb_key_field"):
+            key_field = table.paradedb_key_field
+        elif primary_key_field is None:
+            key_field = table._meta.pk.name
+        else:
+            key_field = primary_key_field
+        self._sql = f"{self._db_table}.{key_field}"
+
     def __str__(self):
-        return self.get_sql()
+        return self._sql
 
     def get_sql(self) -> str:
-        table = self.get_table()
-        if hasattr(self.table, "paradedb_key_field"):
-            key_field = self.table.paradedb_key_field
-        else:
-            key_field = (
-                self.table._meta.pk.name
-                if self.primary_key_field is None
-                else self.primary_key_field
-            )
-        return f"{table}.{key_field}"
+        return self._sql
 
     def get_lhs_sql(self) -> str:
-        return "{} @@@ ".format(self.get_sql())
+        return f"{self._sql} @@@ "
 
     def get_table(self) -> str:
-        if isinstance(self.table, (models.Model, type(models.Model))) or hasattr(
-            self.table, "_meta"
-        ):
-            return self.table._meta.db_table
-        else:
-            return self.table
+        return self._db_table
 
     @classmethod
     def resolve_sql_from_table_column_string(
@@ -52,14 +51,9 @@ class KeyField:
     ) -> "KeyField":
         """Expected table.column format"""
 
-        table_column_string = table_column_string.replace('"', "")
-        assert (
-            table_column_string.split(".").__len__() == 2
-        ), "Expected table.column format"
-        return cls(
-            table=table_column_string.split(".")[0],
-            key_field=table_column_string.split(".")[1],
-        )
+        parts = table_column_string.replace('"', "").split(".")
+        assert len(parts) == 2, "Expected table.column format"
+        return cls(table=parts[0], primary_key_field=parts[1])
 
 
 class TableField:
@@ -79,59 +73,97 @@ class TableField:
         self.field = field
         self.key_field = key_field
 
-    def get_sql(self) -> str:
-        if isinstance(self.table, (models.Model, type(models.Model))):
-            table = self.table._meta.db_table
+        is_model = isinstance(table, (models.Model, type(models.Model)))
+        if is_model:
+            self._table = table._meta.db_table
+        else:
+            self._table = table or key_field.get_table()
+        self._sql = f"{self._table}.{field}"
+
+        if key_field:
+            self._primary_key_field = key_field.primary_key_field
+        elif is_model:
+            self._primary_key_field = getattr(
+                table, "paradedb_key_field", table._meta.pk.name
+            )
         else:
-            table = self.table or self.key_field.get_table()
-        return f"{table}.{self.field}"
+            self._primary_key_field = None
 
-    def get_table_primary_key_field(self):
-        if isinstance(self.key_field, KeyField):
-            return self.key_field.primary_key_field
+    def get_sql(self) -> str:
+        return self._sql
+
+    def get_table(self) -> str:
+        return self._table
 
-        if isinstance(self.table, (models.Model, type(models.Model))):
-            return getattr(self.table, "paradedb_key_field", self.table._meta.pk.name)
+    def get_table_primary_key_field(self):
+        return self._primary_key_field
 
     def __str__(self):
-        return self.get_sql()
+        return self._sql
+
+
+# Per-query memo of resolve_f_model_and_field() results, keyed on (F class, name).
+_F_RESOLVE_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
 def resolve_f_model_and_field(f_expr, query, connection=None):
     if not isinstance(f_expr, models.F):
         raise TypeError("Expected a models.F() expression")
 
-    resolved = f_expr.resolve_expression(query)
+    cache = _F_RESOLVE_CACHE.setdefault(query, {})
+    key = (f_expr.__class__, f_expr.name)
+    result = cache.get(key)
+    if result is None:
+        resolved = f_expr.resolve_expression(query)
+
+        if not isinstance(resolved, Col):
+            raise ValueError("Could not resolve F() expression into a column")
+
+        field = resolved.target
+        result = cache[key] = (field.model, field.name, resolved.alias)
+    return result
 
-    if not isinstance(resolved, Col):
-        raise ValueError("Could not resolve F() expression into a column")
 
-    field = resolved.target
-    return field.model, field.name, resolved.alias
+_PG_STRING_ESCAPE = str.maketrans({"\\": "\\\\", "'": "''"})
+_NUMERIC_TYPES = frozenset({int, float})
+
+
+def _format_array_value(v) -> str:
+    if v is None:
+        return "NULL"
+    # Strings need escaping and quotes
+    if isinstance(v, str):
+        return f"'{v.translate(_PG_STRING_ESCAPE)}'"
+    return str(v)
 
 
 def postgres_array(iterable: typing.Iterable) -> str:
-    def format_value(v):
-        if v is None:
-            return "NULL"
-        # Strings need escaping and quotes
-        if isinstance(v, str):
-            s = v.replace("\\", "\\\\").replace("'", "''")
-            return f"'{s}'"
-        return str(v)
+    items = list(iterable)
+    if (
+        items
+        and items[0].__class__ in _NUMERIC_TYPES
+        and all(v.__class__ in _NUMERIC_TYPES for v in items)
+    ):
+        # Plain numbers render as-is, so skip the per-item formatter.
+        values = ", ".join(map(str, items))
+    else:
+        values = ", ".join(map(_format_array_value, items))
+    return f"ARRAY[{values}]"
 
-    items = ", ".join(format_value(v) for v in iterable)
-    return f"ARRAY[{items}]"
+
+# Every whitespace character str.isspace() (and so regex \s) accepts.
+_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+# All special characters that need escaping, mapped to their backslashed form.
+_ESCAPE_TABLE = str.maketrans(
+    {c: "\\" + c for c in '+^`:{}"[]()<>~!\\*,' + _WHITESPACE}
+)
 
 
 def escape_query(value: str) -> str:
     if not isinstance(value, str):
         return value
-
-    # Define all special characters that need escaping
-    special_chars = r'+^`:{}"\[\]()<>\~!\\*\s,'
-    # Escape each special character by prefixing with a backslash
-    pattern = f"([{special_chars}])"
-    escaped_value = re.sub(pattern, r"\\\1", value)
-
-    return escaped_value
+    return value.translate(_ESCAPE_TABLE)
@@ -178,6 +178,31 @@ class TestExpressions(TestCase):
         )
         bool(qs[:1])
 
+    def test_compiled_predicate_reused_in_boolean(self):
+        compiler = Article.objects.all().query.get_compiler(using="default")
+        regex = Regex("title", "sh.*")
+        compiler.compile(regex)
+        for wrap in (
+            lambda query: Boolean(must=[query]),
+            lambda query: ConstScore(1.0, query),
+        ):
+            self.assertEqual(
+                compiler.compile(wrap(regex)),
+                compiler.compile(wrap(Regex("title", "sh.*"))),
+            )
+
+    def test_predicate_recompiled_with_match_op(self):
+        compiler = Article.objects.all().query.get_compiler(using="default")
+        regex = Regex(models.F("title"), "sh.*", legacy=True)
+        compiler.compile(regex)
+        regex.match_op = True
+        self.assertEqual(
+            compiler.compile(regex),
+            compiler.compile(
+                Regex(models.F("title"), "sh.*", match_op=True, legacy=True)
+            ),
+        )
+
     def test_boost(self):
         qs = Article.objects.filter(
             Boolean(